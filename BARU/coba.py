@@ -1,13 +1,23 @@
+import os
 import sys
-import csv
-import pygame
+import time
+
+# Startup timing (PHYSIM_STARTUP_TIMING=1) counts from here
+STARTED = time.perf_counter()
+
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QLineEdit, QPushButton,
-    QMainWindow, QMessageBox, QGridLayout, QAction, QSizePolicy, QFrame, QSlider, QHBoxLayout, QTextEdit, QSpacerItem
+    QMainWindow, QMessageBox, QGridLayout, QAction, QSizePolicy, QFrame, QSlider, QHBoxLayout, QTextEdit, QSpacerItem,
+    QFileDialog
 )
-from PyQt5.QtGui import QFont, QPalette, QLinearGradient, QColor, QBrush, QPixmap, QImage, QFontMetrics
-from PyQt5.QtCore import Qt, QTimer
-from glbb import GLBBSimulation
+from PyQt5.QtGui import QFont, QPalette, QLinearGradient, QColor, QBrush, QPixmap, QImage, QFontMetrics, QPainter
+from PyQt5.QtCore import Qt, QTimer, QEvent
+# glbb (pymunk, numpy), telemetry and pygame are imported where first
+# used, so none of them are loaded before the login window is up
+from render import QPainterBackend
+from perf import PerfStats, PerfOverlay
+from questions import question_bank
+from credentials import credential_store
 
 # Constants for colors
 COLOR_BACKGROUND_START = "#a2d4f5"
@@ -17,17 +27,224 @@ COLOR_BUTTON_START = "#7aa0ff"
 COLOR_BUTTON_END = "#5e60ce"
 COLOR_ERROR_TEXT = "#111111"
 
-class PygameEmbedWidget(QLabel):
+# Menu topic buttons show icons/1.png ... icons/6.png
+TOPIC_ICON_RULES = "".join(
+    f'QPushButton#topicButton[topic="{i}"] {{ background-image: url(icons/{i}.png); }}\n'
+    for i in range(1, 7))
+
+# One stylesheet for the whole app, set on the QApplication. Widgets pick
+# their rules by objectName; choice buttons switch between the normal,
+# correct and wrong states with set_state() instead of being given a new
+# stylesheet. A disabled normal button (the unpicked ones after an answer)
+# is drawn dimmed, which needs no re-polish at all.
+APP_STYLESHEET = f"""
+QLabel#titleShadowFar {{ color: #93c5fd; }}
+QLabel#titleShadowNear {{ color: #1e40af; }}
+QLabel#titleText {{ color: white; }}
+
+QLineEdit#loginField {{
+    font-size: 16px;
+    padding: 12px;
+    border-radius: 10px;
+    border: 2px solid #ccc;
+}}
+
+QPushButton#primaryButton, QPushButton#loginButton, QPushButton#navButton {{
+    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
+    color: white;
+    padding: 12px 24px;
+    font-size: 18px;
+    font-weight: bold;
+    border: none;
+    border-radius: 20px;
+}}
+QPushButton#loginButton {{ padding: 12px; }}
+QPushButton#navButton {{
+    padding: 12px;
+    min-width: 100px;
+    min-height: 40px;
+}}
+QPushButton#navButton:hover {{ background-color: #2563eb; }}
+
+QLabel#contentText {{
+    color: #6b7280;
+    font-size: 18px;
+}}
+
+QMenuBar#screenMenuBar, QMenuBar#mainMenuBar {{
+    background-color: #ffffff;
+    font-weight: 600;
+    font-size: 14px;
+    color: #111111;
+}}
+QMenuBar#mainMenuBar {{ background-color: #f9f9f9; }}
+QMenuBar#screenMenuBar::item, QMenuBar#mainMenuBar::item {{
+    spacing: 6px;
+    padding: 6px 12px;
+    background: transparent;
+    border-radius: 4px;
+}}
+QMenuBar#screenMenuBar::item:selected, QMenuBar#mainMenuBar::item:selected {{
+    background: #e2e8f0;
+}}
+QMenuBar#screenMenuBar QMenu, QMenuBar#mainMenuBar QMenu {{
+    background-color: #f9f9f9;
+    border: 1px solid #ddd;
+}}
+QMenuBar#screenMenuBar QMenu::item:selected, QMenuBar#mainMenuBar QMenu::item:selected {{
+    background-color: #cbd5e1;
+    color: #111111;
+}}
+
+QSlider#accelerationSlider::groove:horizontal {{
+    border-radius: 8px;
+    height: 12px;
+    background: #e0e2e7;
+}}
+QSlider#accelerationSlider::handle:horizontal {{
+    background: #3b82f6;
+    border-radius: 12px;
+    width: 28px;
+    margin: -8px 0;
+}}
+QSlider#accelerationSlider::handle:horizontal:hover {{ background: #2563eb; }}
+QSlider#accelerationSlider::sub-page:horizontal {{
+    background: #3b82f6;
+    border-radius: 8px;
+}}
+QSlider#accelerationSlider::add-page:horizontal {{
+    background: #e0e2e7;
+    border-radius: 8px;
+}}
+
+QPushButton#topicButton {{
+    background-position: center;
+    background-repeat: no-repeat;
+    background-color: white;
+    border: 1px solid #aaa;
+    border-radius: 8px;
+}}
+QPushButton#topicButton:hover {{ border-color: #0078d4; }}
+{TOPIC_ICON_RULES}
+QLabel#topicLabel {{
+    color: black;
+    font-weight: bold;
+    font-size: 14px;
+}}
+
+QFrame#questionCard {{
+    border: 2px solid #374151;
+    border-radius: 12px;
+    background-color: #cbd5e1;
+}}
+QTextEdit#questionText {{
+    background-color: transparent;
+    border: none;
+    font-size: 16px;
+    color: black;
+    padding-left: 0px;
+}}
+QLabel#questionNumber {{
+    background-color: #a9a9a9;
+    border: 2px solid #374151;
+    border-radius: 20px;
+    font-weight: bold;
+    font-size: 16px;
+    color: black;
+}}
+
+QPushButton#choiceButton {{
+    background-color: #cbd5e1;
+    border: 2px solid #374151;
+    border-radius: 20px;
+    color: black;
+    padding: 10px 0;
+    min-width: 80px;
+}}
+QPushButton#choiceButton[state="normal"]:hover {{ background-color: #94a3b8; }}
+QPushButton#choiceButton[state="correct"] {{
+    background-color: #34d399;
+    border-color: #059669;
+    color: white;
+}}
+QPushButton#choiceButton[state="wrong"] {{
+    background-color: #f87171;
+    border-color: #dc2626;
+    color: white;
+}}
+QPushButton#choiceButton[state="normal"]:disabled {{
+    border-color: #94a3b8;
+    color: #64748b;
+}}
+"""
+
+# GL simulation loop: physics advances in fixed steps of simulated time,
+# independent of how often the render timer fires
+PHYSICS_DT = 1 / 60.0
+RENDER_INTERVAL_MS = 1000 // 60
+MAX_SUBSTEPS = 8  # per render tick; beyond this the backlog is dropped
+
+# Closed screens kept for reuse; older or longer-idle ones are torn down
+SCREEN_CACHE_SIZE = 3
+SCREEN_IDLE_TIMEOUT = 5 * 60  # seconds
+
+STARTUP_TIMING = os.environ.get("PHYSIM_STARTUP_TIMING") == "1"
+
+
+def report_timing(label, since=STARTED):
+    """Print the milliseconds since ``since`` to stderr when timing is on."""
+    if STARTUP_TIMING:
+        print(f"[startup] {label}: {(time.perf_counter() - since) * 1000:.1f} ms", file=sys.stderr)
+
+
+def set_state(widget, state):
+    """Switch ``widget`` to another ``[state=...]`` rule of APP_STYLESHEET.
+
+    Only the widget is re-polished; no stylesheet text is parsed.
+    """
+    if widget.property("state") != state:
+        widget.setProperty("state", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+
+class SimulationWidget(QWidget):
+    """Paints a simulation's `render` commands directly with QPainter.
+
+    No pygame surface is involved: each paintEvent replays the draw
+    commands into the widget.
+    """
+
     def __init__(self, simulation, width, height, parent=None):
         super().__init__(parent)
         self.setFixedSize(width, height)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
         self.simulation = simulation
-
-    def update_display(self):
-        surface = self.simulation.surface
-        raw_str = pygame.image.tostring(surface, "RGBA")
-        qimage = QImage(raw_str, surface.get_width(), surface.get_height(), QImage.Format_RGBA8888)
-        self.setPixmap(QPixmap.fromImage(qimage))
+        self.alpha = 1.0
+        self.font = QFont("Arial")
+        self.font.setPixelSize(20)
+        self.perf = PerfStats()
+        self.overlay = None  # PerfOverlay while shown
+        self.overlay_font = QFont("Monospace")
+        self.overlay_font.setStyleHint(QFont.TypeWriter)
+        self.overlay_font.setPixelSize(12)
+
+    def update_display(self, alpha=1.0):
+        """Repaint at ``alpha`` between the last two physics states."""
+        self.alpha = alpha
+        self.update()
+
+    def paintEvent(self, event):
+        start = time.perf_counter_ns()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.simulation.render(QPainterBackend(painter, self.font), self.alpha)
+        self.perf.add("draw", time.perf_counter_ns() - start)
+        if self.overlay is not None:
+            self.overlay.render(QPainterBackend(painter, self.overlay_font))
+        painter.end()
+        self.perf.add("paint", time.perf_counter_ns() - start)
 
 class ShadowedTitle(QWidget):
     def __init__(self, title, parent=None):
@@ -41,19 +258,19 @@ class ShadowedTitle(QWidget):
         self.setFixedSize(text_width + padding * 2 + 6, text_height + padding * 2 + 6)
         self.shadow1 = QLabel(title, self)
         self.shadow1.setFont(font)
-        self.shadow1.setStyleSheet("color: #93c5fd;")
+        self.shadow1.setObjectName("titleShadowFar")
         self.shadow1.move(padding + 6, padding + 6)
         self.shadow1.setAttribute(Qt.WA_TransparentForMouseEvents)
 
         self.shadow2 = QLabel(title, self)
         self.shadow2.setFont(font)
-        self.shadow2.setStyleSheet("color: #1e40af;")
+        self.shadow2.setObjectName("titleShadowNear")
         self.shadow2.move(padding + 3, padding + 3)
         self.shadow2.setAttribute(Qt.WA_TransparentForMouseEvents)
 
         self.main_text = QLabel(title, self)
         self.main_text.setFont(font)
-        self.main_text.setStyleSheet("color: white;")
+        self.main_text.setObjectName("titleText")
         self.main_text.move(padding, padding)
         self.main_text.setAttribute(Qt.WA_TransparentForMouseEvents)
 
@@ -93,25 +310,17 @@ class Login(QWidget):
 
         self.nim = QLineEdit()
         self.nim.setPlaceholderText("NIM")
-        self.nim.setStyleSheet("font-size: 16px; padding: 12px; border-radius: 10px; border: 2px solid #ccc;")
+        self.nim.setObjectName("loginField")
         layout.addWidget(self.nim)
 
         self.password = QLineEdit()
         self.password.setPlaceholderText("PASSWORD")
         self.password.setEchoMode(QLineEdit.Password)
-        self.password.setStyleSheet("font-size: 16px; padding: 12px; border-radius: 10px; border: 2px solid #ccc;")
+        self.password.setObjectName("loginField")
         layout.addWidget(self.password)
 
         login_btn = QPushButton("Login")
-        login_btn.setStyleSheet(f"""
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-            color: white;
-            padding: 12px;
-            font-size: 18px;
-            font-weight: bold;
-            border: none;
-            border-radius: 20px;
-        """)
+        login_btn.setObjectName("loginButton")
         login_btn.clicked.connect(self.check_login)
         layout.addWidget(login_btn, alignment=Qt.AlignCenter)
 
@@ -120,20 +329,20 @@ class Login(QWidget):
         self.setLayout(layout)
 
     def check_login(self):
-        with open('source/Akun.csv', mode='r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                if self.nim.text() == row['NIM'] and self.password.text() == row['PASSWORD']:
-                    self.menu = Menu(self)
-                    self.menu.show()
-                    self.hide()
-                    return
-            QMessageBox.warning(self, "Login Failed", "NIM atau password salah.")
+        # Loaded once and kept in memory; re-read only when Akun.csv changes
+        accounts = credential_store('source/Akun.csv')
+        if accounts.verify(self.nim.text(), self.password.text()):
+            self.menu = Menu(self)
+            self.menu.show()
+            self.hide()
+            return
+        QMessageBox.warning(self, "Login Failed", "NIM atau password salah.")
 
 class Materi(QMainWindow):
     def __init__(self, menu_window, title):
         super(Materi, self).__init__()
         self.menu_window = menu_window
+        self.hidden_at = None  # time.monotonic() of the last hide; see idle_since()
         self.setWindowTitle(title)
         self.resize(800, 600)
         
@@ -166,7 +375,7 @@ class Materi(QMainWindow):
 
         # Content label that subclasses can customize
         self.content_label = QLabel()
-        self.content_label.setStyleSheet("color: #6b7280; font-size: 18px; line-height: 1.4;")
+        self.content_label.setObjectName("contentText")
         self.content_label.setAlignment(Qt.AlignCenter)
         self.content_label.setWordWrap(True)
         self.main_layout.addWidget(self.content_label, alignment=Qt.AlignTop)
@@ -180,31 +389,7 @@ class Materi(QMainWindow):
 
         # Menu bar (sticky)
         self.menu_bar = self.menuBar()
-        self.menu_bar.setStyleSheet("""
-            QMenuBar {
-                background-color: #ffffff;
-                font-weight: 600;
-                font-size: 14px;
-                color: #111111;
-            }
-            QMenuBar::item {
-                spacing: 6px;
-                padding: 6px 12px;
-                background: transparent;
-                border-radius: 4px;
-            }
-            QMenuBar::item:selected {
-                background: #e2e8f0;
-            }
-            QMenu {
-                background-color: #f9f9f9;
-                border: 1px solid #ddd;
-            }
-            QMenu::item:selected {
-                background-color: #cbd5e1;
-                color: #111111;
-            }
-        """)
+        self.menu_bar.setObjectName("screenMenuBar")
 
         account_menu = self.menu_bar.addMenu("Akun")
         logout_action = QAction("Logout", self)
@@ -219,6 +404,25 @@ class Materi(QMainWindow):
         self.menu_window.show()
         self.close()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.hidden_at = None
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.hidden_at = time.monotonic()
+
+    def in_use(self):
+        """True while this screen, or a window it opened, is on screen."""
+        return self.isVisible()
+
+    def idle_since(self):
+        """When the screen stopped being in use (time.monotonic), or None."""
+        return self.hidden_at
+
+    def dispose(self):
+        """Release resources before the screen manager deletes this screen."""
+
     def logout(self):
         self.menu_window.login_window.show()
         self.menu_window.close()  # Close menu window
@@ -227,14 +431,15 @@ class Materi(QMainWindow):
 class GL(Materi):
     def __init__(self, menu_window):
         super(GL, self).__init__(menu_window, "Gerak Lurus")
+        from glbb import GLBBSimulation, GLBBHistory
         self.simulation = GLBBSimulation(width=800, height=400)
-        self.pygame_widget = PygameEmbedWidget(self.simulation, 800, 400)
-        self.kuis_screen = Kuis(self)
+        self.sim_widget = SimulationWidget(self.simulation, 800, 400)
+        self.kuis_screen = None  # created on first use; it loads the questions
 
-        # Wrap pygame_widget in horizontal layout to center and raise its vertical position
+        # Wrap sim_widget in horizontal layout to center and raise its vertical position
         hbox_sim = QHBoxLayout()
         hbox_sim.addStretch()
-        hbox_sim.addWidget(self.pygame_widget)
+        hbox_sim.addWidget(self.sim_widget)
         hbox_sim.addStretch()
 
         # Add top margin to raise simulation widget visually
@@ -256,31 +461,7 @@ class GL(Materi):
         self.slider.valueChanged.connect(self.update_acceleration)
         self.slider.setFixedWidth(800)
         self.slider.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                border-radius: 8px;
-                height: 12px;
-                background: #e0e2e7;
-            }
-            QSlider::handle:horizontal {
-                background: #3b82f6;
-                border-radius: 12px;
-                width: 28px;
-                margin: -8px 0;
-                transition: background-color 0.3s ease;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #2563eb;
-            }
-            QSlider::sub-page:horizontal {
-                background: #3b82f6;
-                border-radius: 8px;
-            }
-            QSlider::add-page:horizontal {
-                background: #e0e2e7;
-                border-radius: 8px;
-            }
-        """)
+        self.slider.setObjectName("accelerationSlider")
 
         # Put slider inside horizontal layout for centered expansion
         slider_layout = QHBoxLayout()
@@ -290,33 +471,29 @@ class GL(Materi):
         slider_layout.addStretch()
         self.main_layout.addLayout(slider_layout)
 
+        # Scrub slider: rewinds the live simulation or seeks in a replay
+        self.scrub_slider = QSlider(Qt.Horizontal)
+        self.scrub_slider.setFixedWidth(800)
+        self.scrub_slider.valueChanged.connect(self.scrub)
+        self.update_scrub_slider(0, 0, 0)  # nothing to scrub until the first step
+        scrub_layout = QHBoxLayout()
+        scrub_layout.setContentsMargins(0, 0, 0, 0)
+        scrub_layout.addStretch()
+        scrub_layout.addWidget(self.scrub_slider)
+        scrub_layout.addStretch()
+        self.main_layout.addLayout(scrub_layout)
+
         # Buttons for Menu and Kuis in layout constrained by max width
         button_layout = QHBoxLayout()
         button_layout.setSpacing(20)
 
         back_btn = QPushButton("Menu")
-        back_btn.setStyleSheet(f"""
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-            color: white;
-            padding: 12px 24px;
-            font-size: 18px;
-            font-weight: bold;
-            border: none;
-            border-radius: 20px;
-        """)
+        back_btn.setObjectName("primaryButton")
         back_btn.clicked.connect(self.back_to_menu)
         button_layout.addWidget(back_btn)
 
         kuis_btn = QPushButton("Kuis")
-        kuis_btn.setStyleSheet(f"""
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-            color: white;
-            padding: 12px 24px;
-            font-size: 18px;
-            font-weight: bold;
-            border: none;
-            border-radius: 20px;
-        """)
+        kuis_btn.setObjectName("primaryButton")
         kuis_btn.clicked.connect(self.gokuis)
         button_layout.addWidget(kuis_btn)
 
@@ -327,38 +504,284 @@ class GL(Materi):
         button_container.setMaximumWidth(480)  # Constrain buttons to page width approx
         self.main_layout.addWidget(button_container)
 
+        # Session recording and replay
+        self.recorder = None
+        self.replay = None
+        record_menu = self.menu_bar.addMenu("Rekaman")
+        self.record_action = QAction("Mulai Rekam", self)
+        self.record_action.triggered.connect(self.toggle_recording)
+        record_menu.addAction(self.record_action)
+        replay_action = QAction("Putar Rekaman...", self)
+        replay_action.triggered.connect(self.open_replay)
+        record_menu.addAction(replay_action)
+        self.live_action = QAction("Kembali ke Live", self)
+        self.live_action.triggered.connect(self.stop_replay)
+        self.live_action.setEnabled(False)
+        record_menu.addAction(self.live_action)
+        self.telemetry = None
+        self.telemetry_action = QAction("Ekspor Telemetri...", self)
+        self.telemetry_action.triggered.connect(self.toggle_telemetry)
+        record_menu.addAction(self.telemetry_action)
+
+        # Checkpoint history for rewinding the live simulation
+        self.history = GLBBHistory(self.simulation, dt=PHYSICS_DT)
+        self.paused = False
+        sim_menu = self.menu_bar.addMenu("Simulasi")
+        self.pause_action = QAction("Jeda", self)
+        self.pause_action.setShortcut("Space")
+        self.pause_action.triggered.connect(lambda: self.set_paused(not self.paused))
+        sim_menu.addAction(self.pause_action)
+        self.perf_action = QAction("Statistik Performa", self)
+        self.perf_action.setShortcut("F3")
+        self.perf_action.setCheckable(True)
+        self.perf_action.toggled.connect(self.toggle_perf_overlay)
+        sim_menu.addAction(self.perf_action)
+
+        # Ticks only run while the screen is visible and something can
+        # change; see wake() and is_idle()
+        self.accumulator = 0.0
+        self.last_tick = time.perf_counter()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.game_tick)
-        self.timer.start(1000 // 60)
+
+    def wake(self):
+        """(Re)start ticking, e.g. after input; game_tick stops it again when idle."""
+        if self.isVisible() and not self.isMinimized() and not self.timer.isActive():
+            self.accumulator = 0.0
+            self.last_tick = time.perf_counter()
+            self.sim_widget.perf.resume()
+            self.timer.start(RENDER_INTERVAL_MS)
+
+    def is_idle(self):
+        """True when further ticks would not change what is on screen."""
+        if self.paused:
+            return True
+        if self.replay is not None:
+            return self.replay.step >= self.replay.length
+        if self.recorder is not None or self.telemetry is not None:
+            return False  # keep producing per-step data
+        body = self.simulation.box_body
+        return (self.simulation.acceleration == 0 and body.velocity == (0, 0)
+                and body.angular_velocity == 0)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.wake()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def in_use(self):
+        # GL is hidden while its quiz is open; the quiz still needs it
+        return super().in_use() or (self.kuis_screen is not None and self.kuis_screen.isVisible())
+
+    def idle_since(self):
+        if self.kuis_screen is None or self.kuis_screen.hidden_at is None:
+            return self.hidden_at
+        return max(self.hidden_at or 0, self.kuis_screen.hidden_at)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.timer.stop()
+            else:
+                self.wake()
+
+    def toggle_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+            self.record_action.setText("Mulai Rekam")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Simpan Rekaman", "", "Rekaman PhySim (*.rec)")
+        if path:
+            from glbb import GLBBRecorder
+            self.recorder = GLBBRecorder(self.simulation, path, dt=PHYSICS_DT)
+            self.record_action.setText("Berhenti Rekam")
+            self.wake()
+
+    def toggle_telemetry(self):
+        if self.telemetry is not None:
+            telemetry, self.telemetry = self.telemetry, None
+            telemetry.close()
+            self.telemetry_action.setText("Ekspor Telemetri...")
+            if telemetry.error is not None:
+                QMessageBox.warning(self, "Telemetri",
+                                    f"Ekspor telemetri berhenti: {telemetry.error}\n"
+                                    f"{telemetry.rows_written} baris tersimpan, "
+                                    f"{telemetry.dropped} baris tidak tertulis.")
+            elif telemetry.dropped:
+                QMessageBox.warning(self, "Telemetri",
+                                    f"{telemetry.dropped} baris telemetri tidak tertulis "
+                                    "karena penulisan ke disk tertinggal.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Ekspor Telemetri", "",
+                                              "CSV (*.csv);;Telemetri biner (*.tlm)")
+        if path:
+            from telemetry import TelemetryWriter
+            try:
+                self.telemetry = TelemetryWriter(
+                    path, ["step", "time", "position", "velocity", "acceleration"])
+            except OSError as e:
+                QMessageBox.warning(self, "Telemetri", f"File telemetri tidak bisa dibuat: {e}")
+                return
+            self.telemetry_action.setText("Berhenti Ekspor Telemetri")
+            self.wake()
+
+    def open_replay(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Buka Rekaman", "", "Rekaman PhySim (*.rec)")
+        if not path:
+            return
+        if self.recorder is not None:
+            self.toggle_recording()
+        from glbb import GLBBReplay
+        try:
+            replay = GLBBReplay(self.simulation, path)
+            replay.seek(0)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Rekaman", f"Rekaman tidak bisa dibuka: {e}")
+            return
+        self.replay = replay
+        self.set_paused(False)
+        self.slider.setEnabled(False)
+        self.live_action.setEnabled(True)
+        self.update_scrub_slider(self.replay.step, self.replay.length, self.replay.step)
+        self.wake()
+
+    def update_scrub_slider(self, first, last, value):
+        self.scrub_slider.blockSignals(True)
+        self.scrub_slider.setRange(first, last)
+        self.scrub_slider.setValue(value)
+        self.scrub_slider.blockSignals(False)
+
+    def scrub(self, step):
+        self.wake()
+        if self.replay is not None:
+            self.replay.seek(step)
+            return
+        # Rewinding live: pause there; resuming continues from that point
+        if self.recorder is not None:
+            self.toggle_recording()
+        self.set_paused(True)
+        self.history.seek(step)
+        self.slider.blockSignals(True)
+        self.slider.setValue(round(self.simulation.acceleration * 100))
+        self.slider.blockSignals(False)
+        self.slider_label.setText(f"Akselerasi: {self.simulation.acceleration:.2f} m/s²")
+
+    def set_paused(self, paused):
+        self.paused = paused
+        self.pause_action.setText("Lanjut" if paused else "Jeda")
+        self.wake()
+
+    def stop_replay(self):
+        self.replay = None
+        self.live_action.setEnabled(False)
+        self.slider.setEnabled(True)
+        self.simulation.reset()
+        self.history.clear()
+        self.update_scrub_slider(0, 0, 0)
+        self.slider.setValue(0)
+        self.wake()
 
     def gokuis(self):
+        if self.kuis_screen is None:
+            self.kuis_screen = Kuis(self)
         self.kuis_screen.show()
         self.close()
 
+    def dispose(self):
+        self.timer.stop()
+        if self.recorder is not None:
+            self.toggle_recording()
+        if self.telemetry is not None:
+            self.toggle_telemetry()
+        self.replay = None
+        self.history.clear()
+        if self.kuis_screen is not None:
+            self.kuis_screen.close()
+            self.kuis_screen.deleteLater()
+            self.kuis_screen = None
+
+    def toggle_perf_overlay(self, shown):
+        widget = self.sim_widget
+        widget.overlay = None
+        if shown:
+            # Top right, clear of the simulation's own text; step/tick/update
+            # come from game_tick, draw/paint from paintEvent
+            widget.overlay = PerfOverlay(widget.perf, ["tick", "step", "update", "draw", "paint"],
+                                         position=(widget.width() - 310, 10))
+        widget.update()
+
     def update_acceleration(self, value):
         accel_value = value / 100.0
         self.simulation.set_acceleration(accel_value)
         self.slider_label.setText(f"Akselerasi: {accel_value:.2f} m/s²")
+        self.wake()
 
     def game_tick(self):
-        self.simulation.step()
-        self.simulation.draw()
-        self.pygame_widget.update_display()
+        perf = self.sim_widget.perf
+        perf.frame()
+        tick_start = time.perf_counter_ns()
+        now = time.perf_counter()
+        self.accumulator += now - self.last_tick
+        self.last_tick = now
+
+        dt = self.replay.dt if self.replay is not None else PHYSICS_DT
+        if self.paused:
+            self.accumulator = 0.0
+            substeps = 0
+        else:
+            substeps = min(int(self.accumulator / dt), MAX_SUBSTEPS)
+            self.accumulator -= substeps * dt
+            if substeps == MAX_SUBSTEPS:
+                # Too far behind (stalled GUI thread): drop the backlog rather
+                # than trying to catch up and falling further behind
+                self.accumulator = min(self.accumulator, dt)
+
+        step_start = time.perf_counter_ns()
+        if self.replay is not None:
+            if substeps and self.replay.step < self.replay.length:
+                self.replay.seek(self.replay.step + substeps)
+                self.update_scrub_slider(self.scrub_slider.minimum(), self.replay.length, self.replay.step)
+        else:
+            for _ in range(substeps):
+                self.history.capture()
+                if self.recorder is not None:
+                    self.recorder.capture()
+                self.simulation.step(dt)
+                if self.telemetry is not None:
+                    body = self.simulation.box_body
+                    steps = self.simulation.steps
+                    self.telemetry.write((steps, steps * dt, body.position.x, body.velocity.x,
+                                          self.simulation.acceleration))
+            if self.telemetry is not None and self.telemetry.error is not None:
+                # The writer thread hit a disk error; stop now and say so
+                self.toggle_telemetry()
+            if substeps:
+                self.update_scrub_slider(self.history.first_step, self.history.last_step,
+                                         self.simulation.steps)
+        update_start = time.perf_counter_ns()
+        perf.add("step", update_start - step_start)
+        if self.is_idle():
+            # Nothing moves until the next input: show the exact state and
+            # stop ticking until wake()
+            self.timer.stop()
+            self.sim_widget.update_display()
+        else:
+            self.sim_widget.update_display(min(self.accumulator / dt, 1.0))
+        end = time.perf_counter_ns()
+        perf.add("update", end - update_start)
+        perf.add("tick", end - tick_start)
 
 class Newton(Materi):
     def __init__(self, menu_window):
         super(Newton, self).__init__(menu_window, "Hukum Newton")
         self._set_content_text("Penjelasan mengenai hukum Newton akan ditampilkan di sini.")
         back_btn = QPushButton("Menu")
-        back_btn.setStyleSheet(f"""
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-            color: white;
-            padding: 12px 24px;
-            font-size: 18px;
-            font-weight: bold;
-            border: none;
-            border-radius: 20px;
-        """)
+        back_btn.setObjectName("primaryButton")
         back_btn.clicked.connect(self.back_to_menu)
         self.main_layout.addWidget(back_btn)
 
@@ -367,15 +790,7 @@ class Hooke(Materi):
         super(Hooke, self).__init__(menu_window, "Hukum Hooke")
         self._set_content_text("Penjelasan mengenai hukum Hooke akan ditampilkan di sini.")
         back_btn = QPushButton("Menu")
-        back_btn.setStyleSheet(f"""
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-            color: white;
-            padding: 12px 24px;
-            font-size: 18px;
-            font-weight: bold;
-            border: none;
-            border-radius: 20px;
-        """)
+        back_btn.setObjectName("primaryButton")
         back_btn.clicked.connect(self.back_to_menu)
         self.main_layout.addWidget(back_btn)
 
@@ -386,15 +801,7 @@ class Resistor(Materi):
         super(Resistor, self).__init__(menu_window, "Rangkaian Resistor")
         self._set_content_text("Simulasi rangkaian resistor akan ditampilkan di sini.")
         back_btn = QPushButton("Menu")
-        back_btn.setStyleSheet(f"""
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-            color: white;
-            padding: 12px 24px;
-            font-size: 18px;
-            font-weight: bold;
-            border: none;
-            border-radius: 20px;
-        """)
+        back_btn.setObjectName("primaryButton")
         back_btn.clicked.connect(self.back_to_menu)
         self.main_layout.addWidget(back_btn)
 
@@ -404,15 +811,7 @@ class Bandul(Materi):
         super(Bandul, self).__init__(menu_window, "Gerak Harmonik")
         self._set_content_text("Simulasi gerak harmonik sederhana akan ditampilkan di sini.")
         back_btn = QPushButton("Menu")
-        back_btn.setStyleSheet(f"""
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-            color: white;
-            padding: 12px 24px;
-            font-size: 18px;
-            font-weight: bold;
-            border: none;
-            border-radius: 20px;
-        """)
+        back_btn.setObjectName("primaryButton")
         back_btn.clicked.connect(self.back_to_menu)
         self.main_layout.addWidget(back_btn)
 
@@ -422,19 +821,63 @@ class Archimedes(Materi):
         super(Archimedes, self).__init__(menu_window, "Hukum Archimedes")
         self._set_content_text("Penjelasan tentang hukum Archimedes akan ditampilkan di sini.")
         back_btn = QPushButton("Menu")
-        back_btn.setStyleSheet(f"""
-            background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-            color: white;
-            padding: 12px 24px;
-            font-size: 18px;
-            font-weight: bold;
-            border: none;
-            border-radius: 20px;
-        """)
+        back_btn.setObjectName("primaryButton")
         back_btn.clicked.connect(self.back_to_menu)
         self.main_layout.addWidget(back_btn)
 
 
+class ScreenManager:
+    """Creates Menu screens on first use and reuses them on reopen.
+
+    Closed screens stay cached; beyond ``capacity`` the least recently used
+    ones, and any closed for longer than ``idle_timeout`` seconds, are
+    disposed (`Materi.dispose`) and deleted. A screen counts as closed only
+    once neither it nor anything it opened is shown (`Materi.in_use`).
+    """
+
+    def __init__(self, menu_window, factories, capacity=SCREEN_CACHE_SIZE,
+                 idle_timeout=SCREEN_IDLE_TIMEOUT):
+        self.menu_window = menu_window
+        self.factories = factories
+        self.capacity = capacity
+        self.idle_timeout = idle_timeout
+        self.screens = {}  # index -> screen, least recently used first
+        self.timer = QTimer(menu_window)
+        self.timer.timeout.connect(self.evict)
+        self.timer.start(60 * 1000)
+
+    def open(self, index):
+        screen = self.screens.pop(index, None)
+        if screen is None:
+            created = time.perf_counter()
+            screen = self.factories[index](self.menu_window)
+            # The first GL screen includes loading glbb, pymunk and numpy
+            report_timing(f"create {self.factories[index].__name__}", created)
+        self.screens[index] = screen
+        screen.show()
+        self.evict()
+        return screen
+
+    def evict(self):
+        now = time.monotonic()
+        closed = [index for index, screen in self.screens.items() if not screen.in_use()]
+        excess = len(self.screens) - self.capacity
+        for index in closed:
+            since = self.screens[index].idle_since()
+            if excess > 0 or (since is not None and now - since > self.idle_timeout):
+                self.dispose(index)
+                excess -= 1
+
+    def dispose(self, index):
+        screen = self.screens.pop(index)
+        screen.dispose()
+        screen.close()
+        screen.deleteLater()
+
+    def clear(self):
+        for index in list(self.screens):
+            self.dispose(index)
+
 class Menu(QMainWindow):
     def __init__(self, login_window):
         super(Menu, self).__init__()
@@ -444,31 +887,7 @@ class Menu(QMainWindow):
 
         # Menu bar
         menubar = self.menuBar()
-        menubar.setStyleSheet("""
-            QMenuBar {
-                background-color: #f9f9f9;
-                font-weight: 600;
-                font-size: 14px;
-                color: #111111;
-            }
-            QMenuBar::item {
-                spacing: 6px;
-                padding: 6px 12px;
-                background: transparent;
-                border-radius: 4px;
-            }
-            QMenuBar::item:selected {
-                background: #e2e8f0;
-            }
-            QMenu {
-                background-color: #f9f9f9;
-                border: 1px solid #ddd;
-            }
-            QMenu::item:selected {
-                background-color: #cbd5e1;
-                color: #111111;
-            }
-        """)
+        menubar.setObjectName("mainMenuBar")
         account_menu = menubar.addMenu("Akun")
         logout_action = QAction("Logout", self)
         account_menu.addAction(logout_action)
@@ -505,29 +924,17 @@ class Menu(QMainWindow):
         simulasi_labels = ["Gerak Lurus", "Hukum Newton", "Hukum Hooke", "Rangkaian Resistor", "Gerak Harmonik", "Hukum Archimedes"]
 
         for i in range(6):
-            icon_path = f"icons/{i + 1}.png"
             btn = QPushButton()
             btn.setMinimumSize(100, 100)
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            btn.setStyleSheet(f"""
-                               QPushButton {{
-                               background-image: url({icon_path});
-                               background-position: center;
-                               background-repeat: no-repeat;
-                               background-color: white;
-                               border: 1px solid #aaa;
-                               border-radius: 8px;}}
-                               QPushButton:hover {{
-                               border-color: #0078d4;
-                               box-shadow: 0 0 8px rgba(0,120,212,0.6);
-                               }}
-                               """)
+            btn.setObjectName("topicButton")
+            btn.setProperty("topic", i + 1)
             buttons.append(btn)
             btn.clicked.connect(lambda checked, index=i: self.open_screen(index))
 
             label = QLabel(simulasi_labels[i])
             label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("color: black; font-weight: bold; font-size: 14px;")
+            label.setObjectName("topicLabel")
 
             vbox = QVBoxLayout()
             vbox.addWidget(btn)
@@ -539,33 +946,29 @@ class Menu(QMainWindow):
 
         main_layout.addLayout(button_grid)
 
+        self.screens = ScreenManager(self, [GL, Newton, Hooke, Resistor, Bandul, Archimedes])
+
     def open_screen(self, index):
-        # Hide menu when opening a new screen
-        self.hide()
-        if index == 0:
-            self.screen = GL(self)
-        elif index == 1:
-            self.screen = Newton(self)
-        elif index == 2:
-            self.screen = Hooke(self)
-        elif index == 3:
-            self.screen = Resistor(self)
-        elif index == 4:
-            self.screen = Bandul(self)
-        elif index == 5:
-            self.screen = Archimedes(self)
-        else:
+        if not 0 <= index < len(self.screens.factories):
             return
-        self.screen.show()
+        # Hide menu when opening a screen
+        self.hide()
+        self.screen = self.screens.open(index)
 
     def handle_logout(self):
         self.login_window.show()
         self.close()
 
+    def closeEvent(self, event):
+        # Logging out (from here or from a screen) tears every screen down
+        self.screens.clear()
+        super().closeEvent(event)
+
 class Kuis(QMainWindow):
     def __init__(self, menu_window):
         super().__init__()
         self.menu_window = menu_window
+        self.hidden_at = None
         self.setWindowTitle("Kuis")
         self.resize(820, 600)
 
@@ -580,6 +983,7 @@ class Kuis(QMainWindow):
 
         # Menu bar with Akun and Logout action
         menubar = self.menuBar()
+        menubar.setObjectName("screenMenuBar")
         akun_menu = menubar.addMenu("Akun")
         logout_action = QAction("Logout", self)
         akun_menu.addAction(logout_action)
@@ -610,29 +1014,14 @@ class Kuis(QMainWindow):
 
         # Text area container styled as a card with subtle rounded corners and background
         self.text_area_container = QFrame()
-        self.text_area_container.setStyleSheet("""
-            QFrame {
-                border: 2px solid #374151;
-                border-radius: 12px;
-                background-color: #cbd5e1;
-            }
-        """)
+        self.text_area_container.setObjectName("questionCard")
         self.text_area_container.setMinimumHeight(96)
         self.text_area_container.setLayout(QHBoxLayout())
         self.text_area_container.layout().setContentsMargins(48, 12, 12, 12)
         self.text_area_container.layout().setSpacing(0)
 
         self.text_edit = QTextEdit()
-        self.text_edit.setStyleSheet("""
-            QTextEdit {
-                background-color: transparent;
-                border: none;
-                font-size: 16px;
-                color: black;
-                padding-left: 0px;
-                resize: none;
-            }
-        """)
+        self.text_edit.setObjectName("questionText")
         self.text_edit.setFixedHeight(72)
         self.text_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.text_edit.setReadOnly(True)
@@ -641,13 +1030,7 @@ class Kuis(QMainWindow):
         self.number_circle = QLabel("1", self.text_area_container)
         self.number_circle.setFixedSize(40, 40)
         self.number_circle.setAlignment(Qt.AlignCenter)
-        self.number_circle.setStyleSheet("""
-            background-color: #a9a9a9;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 16px;
-            color: black;
-        """)
+        self.number_circle.setObjectName("questionNumber")
         self.number_circle.move(8, 8)
         self.number_circle.raise_()
 
@@ -662,19 +1045,8 @@ class Kuis(QMainWindow):
         for i in range(1, 5):
             btn = QPushButton(f"Pilihan {i}")
             btn.setFont(QFont("Sans Serif", 14, QFont.ExtraBold))
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #cbd5e1;
-                    border: 2px solid #374151;
-                    border-radius: 20px;
-                    color: black;
-                    padding: 10px 0;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #94a3b8;
-                }
-            """)
+            btn.setObjectName("choiceButton")
+            btn.setProperty("state", "normal")
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             btn.setMinimumHeight(40)
             btn.clicked.connect(lambda checked, b=btn: self.check_answer(b))
@@ -690,24 +1062,7 @@ class Kuis(QMainWindow):
         # Next button styled according to DEFAULT design
         self.next_button = QPushButton("Next", self)
         self.next_button.setFont(QFont("Sans Serif", 14, QFont.ExtraBold))
-        self.next_button.setStyleSheet("""
-            QPushButton {
-                background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 {COLOR_BUTTON_START}, stop:1 {COLOR_BUTTON_END});
-                color: white;
-                font-size: 18px;
-                border: none;
-                border-radius: 20px;
-                color: white;
-                padding: 12px;
-                font-weight: bold;
-                min-width: 100px;
-                min-height: 40px;
-                transition: background-color 0.3s ease;
-            }
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-        """)
+        self.next_button.setObjectName("navButton")
         self.next_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.next_button.clicked.connect(self.next_question)
         main_layout.addWidget(self.next_button, alignment=Qt.AlignCenter)
@@ -716,7 +1071,7 @@ class Kuis(QMainWindow):
         # Menu button styled exactly like Next button
         self.menu_button = QPushButton("Menu", self)
         self.menu_button.setFont(QFont("Sans Serif", 14, QFont.ExtraBold))
-        self.menu_button.setStyleSheet(self.next_button.styleSheet())
+        self.menu_button.setObjectName("navButton")
         self.menu_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         self.menu_button.clicked.connect(self.back_to_menu)
         main_layout.addWidget(self.menu_button, alignment=Qt.AlignCenter)
@@ -728,38 +1083,22 @@ class Kuis(QMainWindow):
         self.display_question()
 
     def load_questions(self, file_path):
-        questions = []
-        with open(file_path, mode='r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                questions.append(row)
-        return questions
+        # Shared bank: parsed once per process, re-read only if the file changed
+        return question_bank(file_path).questions()
 
     def display_question(self):
         question = self.questions[self.current_question_index]
-        self.text_edit.setPlainText(question['soal'])
+        self.text_edit.setPlainText(question.soal)
         self.number_circle.setText(str(self.current_question_index + 1))
-        self.choice_buttons[0].setText(question['a'])
-        self.choice_buttons[1].setText(question['b'])
-        self.choice_buttons[2].setText(question['c'])
-        self.choice_buttons[3].setText(question['d'])
+        self.choice_buttons[0].setText(question.a)
+        self.choice_buttons[1].setText(question.b)
+        self.choice_buttons[2].setText(question.c)
+        self.choice_buttons[3].setText(question.d)
 
         # When displaying a question reset buttons
         for btn in self.choice_buttons:
             btn.setEnabled(True)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #cbd5e1;
-                    border: 2px solid #374151;
-                    border-radius: 20px;
-                    color: black;
-                    padding: 10px 0;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #94a3b8;
-                }
-            """)
+            set_state(btn, "normal")
 
         # Hide both navigation buttons until user answers
         self.next_button.hide()
@@ -771,48 +1110,16 @@ class Kuis(QMainWindow):
             btn.setEnabled(False)
 
         question = self.questions[self.current_question_index]
-        correct_answer_text = question.get('correct', '').strip()
+        correct_answer_text = question.correct.strip()
         selected_text = selected_button.text()
 
-        # Highlight buttons according to correctness
+        # Highlight buttons according to correctness; the rest stay
+        # "normal" and, being disabled, are drawn dimmed
         for btn in self.choice_buttons:
             if btn.text() == correct_answer_text:
-                # Correct answer style - green
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #34d399;
-                        border: 2px solid #059669;
-                        border-radius: 20px;
-                        color: white;
-                        padding: 10px 0;
-                        min-width: 80px;
-                    }
-                """)
+                set_state(btn, "correct")
             elif btn == selected_button:
-                # Wrong answer style - red
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #f87171;
-                        border: 2px solid #dc2626;
-                        border-radius: 20px;
-                        color: white;
-                        padding: 10px 0;
-                        min-width: 80px;
-                    }
-                """)
-            else:
-                # Other buttons dimmed
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #cbd5e1;
-                        border: 2px solid #374151;
-                        border-radius: 20px;
-                        color: black;
-                        padding: 10px 0;
-                        opacity: 0.6;
-                        min-width: 80px;
-                    }
-                """)
+                set_state(btn, "wrong")
 
         # Show next or menu button after answer
         if self.current_question_index < len(self.questions) - 1:
@@ -831,6 +1138,14 @@ class Kuis(QMainWindow):
         margin = 32
         pass
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.hidden_at = None
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.hidden_at = time.monotonic()
+
     def back_to_menu(self):
         self.menu_window.menu_window.show()
         self.close()
@@ -841,12 +1156,17 @@ class Kuis(QMainWindow):
         self.close()
 
 if __name__ == "__main__":
-    pygame.init()
-    pygame.font.init()
+    # No pygame.init(): the Qt screens never touch pygame, and the pygame
+    # parts that do (fonts for GLBBSimulation.draw) initialise only that module
+    report_timing("imports")
     app = QApplication(sys.argv)
     app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    app.setStyleSheet(APP_STYLESHEET)
+    report_timing("QApplication")
     login_window = Login()
     login_window.show()
+    # Runs once the event loop has painted the login window
+    QTimer.singleShot(0, lambda: report_timing("login window shown"))
     sys.exit(app.exec_())
 
@@ -0,0 +1,123 @@
+"""Account lookup for the login screen.
+
+`credential_store(path)` returns the one `CredentialStore` for an account
+CSV (columns ``NIM,PASSWORD``). The file is loaded once into a dict keyed
+by NIM and reloaded only when its modification time or size changes, so
+a login is a dict lookup rather than a file scan.
+
+``PASSWORD`` is either a salted hash from `hash_password`
+(``pbkdf2_sha256$<iterations>$<salt hex>$<hash hex>``) or, for rosters
+not converted yet, plain text. Convert a roster in place with::
+
+    python credentials.py source/Akun.csv
+"""
+import csv
+import hashlib
+import hmac
+import os
+import sys
+from collections import OrderedDict
+
+from filecache import FileBacked, shared
+
+SCHEME = "pbkdf2_sha256"
+ITERATIONS = 200_000
+SALT_BYTES = 16
+VERIFY_CACHE_SIZE = 1024
+
+# Keys the verifier cache so it never holds passwords themselves
+_CACHE_KEY = os.urandom(32)
+
+
+def hash_password(password, salt=None, iterations=ITERATIONS):
+    salt = os.urandom(SALT_BYTES) if salt is None else salt
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    return f"{SCHEME}${iterations}${salt.hex()}${digest.hex()}"
+
+
+def is_hashed(stored):
+    return stored.startswith(SCHEME + "$")
+
+
+def check_password(stored, password):
+    """Compare ``password`` against a stored hash or plain-text value."""
+    if not is_hashed(stored):
+        return hmac.compare_digest(stored.encode("utf-8"), password.encode("utf-8"))
+    try:
+        _, iterations, salt, expected = stored.split("$")
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"),
+                                     bytes.fromhex(salt), int(iterations))
+    except ValueError:
+        return False
+    return hmac.compare_digest(digest.hex(), expected)
+
+
+class CredentialStore(FileBacked):
+    def __init__(self, path):
+        super().__init__(path)
+        self.accounts = {}
+        # (stored hash, keyed password digest) -> True, for recent successes
+        self._verified = OrderedDict()
+
+    def _load(self):
+        with open(self.path, mode='r', encoding='utf-8', newline='') as file:
+            # Short rows (no PASSWORD) can never log in; leave them out
+            self.accounts = {row['NIM']: row['PASSWORD'] for row in csv.DictReader(file)
+                             if row.get('NIM') is not None and row.get('PASSWORD') is not None}
+        self._verified.clear()
+
+    def __contains__(self, nim):
+        return nim in self.accounts
+
+    def verify(self, nim, password):
+        stored = self.accounts.get(nim)
+        if stored is None:
+            return False
+        if not is_hashed(stored):
+            return check_password(stored, password)
+
+        # PBKDF2 is deliberately slow; repeat logins of the same account
+        # (e.g. a whole lab session) skip it. Failures are never cached.
+        key = (stored, hmac.new(_CACHE_KEY, password.encode("utf-8"), hashlib.sha256).digest())
+        if key in self._verified:
+            self._verified.move_to_end(key)
+            return True
+        if not check_password(stored, password):
+            return False
+        self._verified[key] = True
+        if len(self._verified) > VERIFY_CACHE_SIZE:
+            self._verified.popitem(last=False)
+        return True
+
+
+def credential_store(path):
+    """The shared, up-to-date `CredentialStore` for ``path``."""
+    return shared(CredentialStore, path)
+
+
+def hash_file(path):
+    """Replace every plain-text password in an account CSV with a hash.
+
+    Rows without a PASSWORD are written back exactly as they were.
+    """
+    with open(path, mode='r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        fields = next(reader)
+        rows = list(reader)
+    # Plain rows rather than DictReader, which would turn a missing
+    # password into an empty one on the way back out
+    column = fields.index('PASSWORD')
+    converted = 0
+    for row in rows:
+        if len(row) > column and not is_hashed(row[column]):
+            row[column] = hash_password(row[column])
+            converted += 1
+    with open(path, mode='w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(fields)
+        writer.writerows(rows)
+    return converted
+
+if __name__ == "__main__":
+    for account_file in sys.argv[1:]:
+        print(f"{account_file}: {hash_file(account_file)} passwords hashed")
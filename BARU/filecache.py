@@ -0,0 +1,38 @@
+"""Process-wide objects loaded from a file and reloaded when it changes.
+
+A `FileBacked` subclass implements `_load`; `refresh` calls it on first
+use and again only when the file's modification time or size changes.
+`shared(cls, path)` returns the one up-to-date instance per class and
+file, so every screen reuses what was already parsed.
+"""
+import os
+
+
+class FileBacked:
+    def __init__(self, path):
+        self.path = path
+        self._stamp = None
+
+    def refresh(self):
+        """Reload the file if it changed since the last load."""
+        stat = os.stat(self.path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            self._load()
+            self._stamp = stamp
+        return self
+
+    def _load(self):
+        raise NotImplementedError
+
+
+_instances = {}
+
+
+def shared(cls, path):
+    """The shared, refreshed ``cls`` instance for ``path``."""
+    key = (cls, os.path.abspath(path))
+    instance = _instances.get(key)
+    if instance is None:
+        instance = _instances[key] = cls(key[1])
+    return instance.refresh()
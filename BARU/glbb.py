@@ -1,14 +1,128 @@
 # glbb_revised_v3.py
 
-import pygame
+import bisect
+import math
+from collections import deque
+
+import numpy as np
 import pymunk
 
+from recording import EVENT, KEYFRAME, KEYFRAME_INTERVAL, Replay, SessionWriter
+from render import PygameBackend
+
+# Checkpoint untuk putar balik: tiap 30 step, 1200 buah = 10 menit pada 60 Hz
+CHECKPOINT_INTERVAL = 30
+CHECKPOINT_CAPACITY = 1200
+
+# Satu record rekaman: kind/step + keadaan lengkap kotak
+RECORD_DTYPE = np.dtype([
+    ("kind", "u1"), ("step", "u4"),
+    ("acceleration", "f8"),
+    ("x", "f8"), ("y", "f8"), ("vx", "f8"), ("vy", "f8"),
+    ("angle", "f8"), ("angular_velocity", "f8"),
+])
+
+def _first_positive(qa, qb, qc):
+    """Bilangan bulat k >= 1 terkecil dengan qa·k² + qb·k + qc > 0, atau None."""
+    def f(k):
+        return (qa * k + qb) * k + qc
+
+    if f(1) > 0:
+        return 1
+    if qa == 0:
+        if qb <= 0:
+            return None
+        root = -qc / qb
+    else:
+        disc = qb * qb - 4 * qa * qc
+        if disc < 0:
+            return None
+        roots = ((-qb - math.sqrt(disc)) / (2 * qa), (-qb + math.sqrt(disc)) / (2 * qa))
+        # qa > 0: positif setelah akar terbesar; qa < 0: positif di antara kedua akar
+        root = max(roots) if qa > 0 else min(roots)
+    # Koreksi pembulatan akar
+    k = max(2, math.floor(root) + 1)
+    if k > 2 and f(k - 1) > 0:
+        k -= 1
+    if f(k) <= 0:
+        k += 1
+        if f(k) <= 0:
+            return None
+    return k
+
+
+class AnalyticMotion:
+    """Gerak kotak untuk percepatan konstan dalam bentuk tertutup.
+
+    Meniru `GLBBSimulation.step` persis: pymunk memajukan posisi dengan
+    kecepatan lama baru kemudian kecepatannya, jadi setelah k step
+    x = x0 + k·v0·dt + ½·a·dt²·k(k-1) dan v = v0 + k·a·dt. Saat kotak
+    menabrak dinding (dicari dari akar persamaan kuadrat) gerak dilanjutkan
+    sebagai segmen baru dari dinding, sehingga keadaan di step mana pun
+    didapat dalam O(1) tanpa space.step.
+    """
+
+    def __init__(self, x, v, acceleration, dt, left, right):
+        self.acceleration = acceleration
+        self.dt = dt
+        self.left = left
+        self.right = right
+
+        # (step awal, x0, v0, tertahan di dinding?)
+        segments = []
+        start = 0
+        while True:
+            segments.append((start, x, v, False))
+            k, wall = self._exit(x, v)
+            if k is None:
+                break
+            start += k
+            x, v = wall, 0.0
+            if (wall == right and acceleration > 0) or (wall == left and acceleration < 0):
+                # Terus didorong ke dinding: x tetap, v bergantian 0 dan a·dt
+                segments.append((start, x, v, True))
+                break
+        self.starts = np.array([s[0] for s in segments])
+        self.x0 = np.array([s[1] for s in segments], dtype=float)
+        self.v0 = np.array([s[2] for s in segments], dtype=float)
+        self.pinned = np.array([s[3] for s in segments])
+
+    def _exit(self, x, v):
+        """Step pertama (relatif) saat kotak melewati dinding, dan dinding itu."""
+        a, dt = self.acceleration, self.dt
+        qa = 0.5 * a * dt * dt
+        qb = v * dt - qa
+        past_right = _first_positive(qa, qb, x - self.right)
+        past_left = _first_positive(-qa, -qb, self.left - x)
+        if past_right is None and past_left is None:
+            return None, None
+        if past_left is None or (past_right is not None and past_right < past_left):
+            return past_right, self.right
+        return past_left, self.left
+
+    def state(self, step):
+        """``(x, v)`` setelah ``step`` step; ``step`` boleh berupa array."""
+        step = np.asarray(step)
+        i = np.searchsorted(self.starts, step, side="right") - 1
+        k = step - self.starts[i]
+        a, dt = self.acceleration, self.dt
+        x0, v0 = self.x0[i], self.v0[i]
+        x = np.where(self.pinned[i], x0, x0 + k * v0 * dt + 0.5 * a * dt * dt * k * (k - 1))
+        v = np.where(self.pinned[i], (k % 2) * a * dt, v0 + k * a * dt)
+        if step.ndim == 0:
+            return float(x), float(v)
+        return x, v
+
+
 class GLBBSimulation:
-    def __init__(self, width=800, height=400):
+    def __init__(self, width=800, height=400, mass=2, friction=0.9):
         self.width = width
         self.height = height
-        self.surface = pygame.Surface((width, height))
-        self.font = pygame.font.SysFont("Arial", 20)
+        # Surface dan font baru dibuat saat draw() pertama kali dipanggil,
+        # jadi simulasi tanpa tampilan (batch, tes, GUI Qt) tidak memuat pygame
+        self._surface = None
+        self._font = None
+        self._backend = None
 
         # Simpan posisi awal untuk keperluan reset
         self.floor_y = self.height - 60
@@ -33,11 +147,11 @@ class GLBBSimulation:
 
         # Objek kotak
         self.box_width, self.box_height = 60, 40
-        self.mass = 2
+        self.mass = mass
         self.moment = pymunk.moment_for_box(self.mass, (self.box_width, self.box_height))
         self.box_body = pymunk.Body(self.mass, self.moment)
         self.box_shape = pymunk.Poly.create_box(self.box_body, (self.box_width, self.box_height))
-        self.box_shape.friction = 0.9
+        self.box_shape.friction = friction
         self.space.add(self.box_body, self.box_shape)
 
         # Kontrol akselerasi
@@ -46,13 +160,40 @@ class GLBBSimulation:
         # Panggil reset untuk mengatur kondisi awal
         self.reset()
 
+    @property
+    def surface(self):
+        if self._surface is None:
+            import pygame
+            self._surface = pygame.Surface((self.width, self.height))
+        return self._surface
+
+    @property
+    def font(self):
+        if self._font is None:
+            import pygame
+            # Cukup modul font; subsistem lain (audio, display) tidak perlu
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._font = pygame.font.SysFont("Arial", 20)
+        return self._font
+
+    @property
+    def backend(self):
+        """Backend pygame untuk draw(); menggambar ke `surface`."""
+        if self._backend is None:
+            self._backend = PygameBackend(self.surface, self.font)
+        return self._backend
+
     def set_acceleration(self, acc):
         self.acceleration = acc
 
     def step(self, dt=1/60.0):
+        # Keadaan sebelum step dipakai draw(alpha) untuk interpolasi
+        self._previous = (self.box_body.position, self.box_body.angle)
         force_x = self.mass * self.acceleration
         self.box_body.force = (force_x, 0)
         self.space.step(dt)
+        self.steps += 1
 
         # --- PENAMBAHAN 1: BATASAN GERAK KOTAK ---
         pos_x = self.box_body.position.x
@@ -69,52 +210,227 @@ class GLBBSimulation:
             self.box_body.velocity = (0, self.box_body.velocity.y)
 
 
-    def draw(self):
-        self.surface.fill(self.BG_COLOR)
-        pygame.draw.line(self.surface, self.FLOOR_COLOR, (0, self.floor_y), (self.width, self.floor_y), 6)
-        
+    def is_analytic(self):
+        """True kalau gerak kotak murni percepatan konstan sepanjang sumbu x.
+
+        Tanpa gravitasi tidak ada gaya normal, jadi gesekan lantai nol; benda
+        lain di space, putaran atau kecepatan vertikal butuh pymunk.
+        """
+        body = self.box_body
+        return (self.space.gravity == (0, 0) and len(self.space.shapes) == 2
+                and body.angle == 0 and body.angular_velocity == 0 and body.velocity.y == 0)
+
+    def motion(self, dt=1/60.0):
+        """`AnalyticMotion` dari keadaan sekarang dengan percepatan sekarang."""
+        half_width = self.box_width / 2
+        body = self.box_body
+        return AnalyticMotion(body.position.x, body.velocity.x, self.acceleration, dt,
+                              half_width, self.width - half_width)
+
+    def advance(self, steps, dt=1/60.0):
+        """Sama dengan memanggil step(dt) sebanyak ``steps`` kali.
+
+        Dihitung langsung dengan `AnalyticMotion` bila bisa, jadi biayanya
+        tetap berapa pun ``steps``; kalau tidak, kembali ke pymunk.
+        """
+        if steps <= 0:
+            return
+        if not self.is_analytic():
+            for _ in range(steps):
+                self.step(dt)
+            return
+        motion = self.motion(dt)
+        body = self.box_body
+        y = body.position.y
+        x_prev, _ = motion.state(steps - 1)
+        x, v = motion.state(steps)
+        self._previous = (pymunk.Vec2d(x_prev, y), body.angle)
+        body.position = (x, y)
+        body.velocity = (v, 0)
+        self.steps += steps
+
+    def draw(self, alpha=1.0):
+        """Gambar ke `surface` dengan pygame (lihat `render`)."""
+        self.render(self.backend, alpha)
+
+    def render(self, backend, alpha=1.0):
+        """Kirim perintah gambar ke ``backend`` (lihat render.py) untuk keadaan
+        di antara step sebelumnya (alpha=0) dan sekarang (alpha=1)."""
+        prev_pos, prev_angle = self._previous
+        position = prev_pos.interpolate_to(self.box_body.position, alpha)
+        angle = prev_angle + (self.box_body.angle - prev_angle) * alpha
+
+        backend.fill(self.BG_COLOR)
+        backend.line((0, self.floor_y), (self.width, self.floor_y), self.FLOOR_COLOR, 6)
+
         # Gambar kotak
-        points = [self.box_body.position + p.rotated(self.box_body.angle) for p in self.box_shape.get_vertices()]
-        points_tuple = [(int(p.x), int(p.y)) for p in points]
-        pygame.draw.polygon(self.surface, self.BOX_COLOR, points_tuple)
+        points = [position + p.rotated(angle) for p in self.box_shape.get_vertices()]
+        backend.polygon([(p.x, p.y) for p in points], self.BOX_COLOR)
 
         # --- PENAMBAHAN 2: MENGGAMBAR VEKTOR PERCEPATAN ---
         if self.acceleration != 0:
-            # Tentukan titik awal, panjang, dan titik akhir panah
-            start_pos = self.box_body.position
             # Skalakan panjang panah agar terlihat bagus (panjang = percepatan * 3)
-            arrow_length = self.acceleration * 3 
-            end_pos = start_pos + (arrow_length, 0)
-            
-            # Gambar garis utama panah
-            pygame.draw.line(self.surface, self.ARROW_COLOR, start_pos, end_pos, 3)
-            
-            # Gambar mata panah
-            arrow_head_length = 8
-            if arrow_length > 0: # Panah ke kanan
-                p1 = (end_pos.x - arrow_head_length, end_pos.y - arrow_head_length)
-                p2 = (end_pos.x - arrow_head_length, end_pos.y + arrow_head_length)
-            else: # Panah ke kiri
-                p1 = (end_pos.x + arrow_head_length, end_pos.y - arrow_head_length)
-                p2 = (end_pos.x + arrow_head_length, end_pos.y + arrow_head_length)
-
-            pygame.draw.line(self.surface, self.ARROW_COLOR, end_pos, p1, 3)
-            pygame.draw.line(self.surface, self.ARROW_COLOR, end_pos, p2, 3)
-
-        # Gambar teks info (tidak berubah)
-        vel_x = self.box_body.velocity.x
-        accel_text = f"Acceleration (m/s²): {self.acceleration:.2f}"
-        vel_text = f"Velocity (m/s): {vel_x:.2f}"
-        pos_text = f"Position (m): {self.box_body.position.x:.2f}"
-        self.surface.blit(self.font.render(accel_text, True, (0, 0, 0)), (10, 10))
-        self.surface.blit(self.font.render(vel_text, True, (0, 0, 0)), (10, 35))
-        self.surface.blit(self.font.render(pos_text, True, (0, 0, 0)), (10, 60))
+            arrow_length = self.acceleration * 3
+            end_pos = position + (arrow_length, 0)
+            backend.arrow(tuple(position), tuple(end_pos), self.ARROW_COLOR, 3, head=8)
+
+        # Gambar teks info
+        backend.text((
+            f"Acceleration (m/s²): {self.acceleration:.2f}",
+            f"Velocity (m/s): {self.box_body.velocity.x:.2f}",
+            f"Position (m): {self.box_body.position.x:.2f}",
+        ), (10, 10), (0, 0, 0), 25)
 
     def reset(self):
-        """Fungsi ini tidak berubah."""
+        """Kembalikan ke keadaan awal: akselerasi nol, kotak diam tanpa rotasi
+        di posisi awal, `steps` nol, dan `_previous` (untuk interpolasi)
+        sama dengan keadaan sekarang."""
         self.acceleration = 0.0
         self.box_body.position = self.initial_pos
         self.box_body.velocity = (0, 0)
         self.box_body.angle = 0
         self.box_body.angular_velocity = 0
-        self.box_body.force = (0, 0)
\ No newline at end of file
+        self.box_body.force = (0, 0)
+        self.steps = 0
+        self._previous = (self.box_body.position, self.box_body.angle)
+
+    def snapshot(self):
+        """Keadaan lengkap simulasi sebagai dict (untuk rekaman)."""
+        body = self.box_body
+        return {
+            "step": self.steps,
+            "acceleration": self.acceleration,
+            "x": body.position.x, "y": body.position.y,
+            "vx": body.velocity.x, "vy": body.velocity.y,
+            "angle": body.angle, "angular_velocity": body.angular_velocity,
+        }
+
+    def restore(self, state):
+        """Kembalikan keadaan dari `snapshot` (atau record rekaman)."""
+        body = self.box_body
+        self.steps = int(state["step"])
+        self.acceleration = float(state["acceleration"])
+        body.position = (float(state["x"]), float(state["y"]))
+        body.velocity = (float(state["vx"]), float(state["vy"]))
+        body.angle = float(state["angle"])
+        body.angular_velocity = float(state["angular_velocity"])
+        body.force = (0, 0)
+        self._previous = (body.position, body.angle)
+
+
+class GLBBRecorder:
+    """Merekam sesi GLBB: event perubahan akselerasi + keyframe berkala.
+
+    Panggil `capture()` tepat sebelum setiap `simulation.step()`.
+    """
+
+    def __init__(self, simulation, path, dt=1/60.0, keyframe_interval=KEYFRAME_INTERVAL):
+        self.simulation = simulation
+        self.keyframe_interval = keyframe_interval
+        self.writer = SessionWriter(path, RECORD_DTYPE, {"simulation": "glbb", "dt": dt})
+        self._last_acceleration = None
+
+    def capture(self):
+        sim = self.simulation
+        if sim.steps % self.keyframe_interval == 0 or self._last_acceleration is None:
+            self.writer.record(kind=KEYFRAME, **sim.snapshot())
+        if sim.acceleration != self._last_acceleration:
+            self.writer.record(kind=EVENT, step=sim.steps, acceleration=sim.acceleration)
+            self._last_acceleration = sim.acceleration
+
+    def close(self):
+        # Keyframe penutup supaya panjang rekaman = step terakhir
+        self.writer.record(kind=KEYFRAME, **self.simulation.snapshot())
+        self.writer.close()
+
+
+class GLBBHistory:
+    """Riwayat dalam memori untuk memutar balik simulasi GLBB.
+
+    Tiap ``interval`` step disimpan satu `snapshot` ke ring berukuran tetap
+    dan setiap perubahan akselerasi dicatat. `seek(step)` memulihkan
+    checkpoint terdekat sebelum step itu lalu hanya menjalankan sisanya.
+    Panggil `capture()` tepat sebelum setiap `simulation.step()`.
+    """
+
+    def __init__(self, simulation, dt=1/60.0, interval=CHECKPOINT_INTERVAL,
+                 capacity=CHECKPOINT_CAPACITY):
+        self.simulation = simulation
+        self.dt = dt
+        self.interval = interval
+        self.checkpoints = deque(maxlen=capacity)
+        self.inputs = deque()  # (step, akselerasi)
+        self.clear()
+
+    def clear(self):
+        self.checkpoints.clear()
+        self.inputs.clear()
+        self.last_step = self.simulation.steps
+        self._acceleration = None
+
+    @property
+    def first_step(self):
+        return self.checkpoints[0]["step"] if self.checkpoints else self.simulation.steps
+
+    def capture(self):
+        sim = self.simulation
+        step = sim.steps
+        if step < self.last_step:
+            # Lanjut dari titik yang diputar balik: masa depan lama dibuang
+            while self.checkpoints and self.checkpoints[-1]["step"] >= step:
+                self.checkpoints.pop()
+            while self.inputs and self.inputs[-1][0] >= step:
+                self.inputs.pop()
+            self._acceleration = None
+        if step % self.interval == 0 or not self.checkpoints:
+            self.checkpoints.append(sim.snapshot())
+            # Input sebelum checkpoint tertua tidak dibutuhkan lagi
+            while self.inputs and self.inputs[0][0] < self.checkpoints[0]["step"]:
+                self.inputs.popleft()
+        if sim.acceleration != self._acceleration:
+            self.inputs.append((step, sim.acceleration))
+            self._acceleration = sim.acceleration
+        self.last_step = step + 1
+
+    def seek(self, step):
+        """Ke ``step`` (dibatasi ke rentang riwayat); kembalikan step tujuan."""
+        if not self.checkpoints:
+            return self.simulation.steps
+        step = max(self.first_step, min(int(step), self.last_step))
+        steps = [checkpoint["step"] for checkpoint in self.checkpoints]
+        checkpoint = self.checkpoints[bisect.bisect_right(steps, step) - 1]
+
+        sim = self.simulation
+        sim.restore(checkpoint)
+        for input_step, acceleration in self.inputs:
+            if input_step > step:
+                break
+            if input_step >= checkpoint["step"]:
+                sim.advance(input_step - sim.steps, self.dt)
+                sim.set_acceleration(acceleration)
+        sim.advance(step - sim.steps, self.dt)
+        return step
+
+
+class GLBBReplay(Replay):
+    """Memutar ulang rekaman GLBB ke `simulation`; `seek(step)` langsung ke step mana pun."""
+
+    kind = "glbb"
+
+    def __init__(self, simulation, path):
+        super().__init__(path)
+        self.simulation = simulation
+        self.dt = self.reader.meta.get("dt", 1/60.0)
+
+    def restore(self, index):
+        self.simulation.restore(self.reader.records[index])
+        return index + 1
+
+    def apply(self, event):
+        self.simulation.set_acceleration(float(event["acceleration"]))
+
+    def advance(self):
+        self.simulation.step(self.dt)
+
+    def advance_many(self, steps):
+        self.simulation.advance(steps, self.dt)
\ No newline at end of file
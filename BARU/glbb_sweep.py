@@ -0,0 +1,114 @@
+"""Headless parameter sweep for the GLBB simulation.
+
+Every combination of acceleration and duration is run headless (no window, no pygame.init) and sampled once per step. Runs the
+closed-form `AnalyticMotion` covers are evaluated in one vectorized call;
+anything else falls back to `GLBBSimulation.step`.
+Runs are spread over a process pool and stacked into NumPy arrays, so
+reference curves and answer keys no longer need the GUI slider. Example::
+
+    python glbb_sweep.py --acceleration -20 -10 10 20 --duration 3 5 --out glbb.npz
+
+Position and velocity are in simulation units (pixels and pixels/s), the
+same values the HUD shows.
+
+Mass and friction are not sweep axes because they do not change the
+result. The slider sets an acceleration, and the applied force is
+``mass * acceleration``. Gravity is zero, so there is no normal force for
+friction to act on.
+"""
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from glbb import GLBBSimulation
+
+DT = 1 / 60.0
+
+
+def parameter_grid(accelerations, durations=(5.0,)):
+    """Every combination as a structured array with one row per run."""
+    grid = np.array(list(itertools.product(accelerations, durations)),
+                    dtype=float).reshape(-1, 2)
+    runs = np.zeros(len(grid), dtype=[("acceleration", "f8"), ("duration", "f8")])
+    for column, name in enumerate(runs.dtype.names):
+        runs[name] = grid[:, column]
+    return runs
+
+
+def simulate(acceleration, steps, dt=DT):
+    """Run one GLBB from rest and return ``(position, velocity)`` of length
+    ``steps + 1``; sample 0 is the starting state."""
+    sim = GLBBSimulation()
+    sim.set_acceleration(acceleration)
+    if sim.is_analytic():
+        return sim.motion(dt).state(np.arange(steps + 1))
+    body = sim.box_body
+    position = np.empty(steps + 1)
+    velocity = np.empty(steps + 1)
+    position[0], velocity[0] = body.position.x, body.velocity.x
+    for i in range(1, steps + 1):
+        sim.step(dt)
+        position[i], velocity[i] = body.position.x, body.velocity.x
+    return position, velocity
+
+
+def _simulate_run(args):
+    return simulate(*args)
+
+
+def run_sweep(runs, dt=DT, workers=None):
+    """Simulate every row of ``runs`` (see `parameter_grid`).
+
+    Returns a dict with ``time`` of shape ``(T,)`` and ``position`` and
+    ``velocity`` of shape ``(len(runs), T)``, where ``T`` covers the longest
+    duration; shorter runs are padded with NaN. Rows keep input order.
+    """
+    steps = np.rint(runs["duration"] / dt).astype(int)
+    length = int(steps.max()) + 1 if len(runs) else 1
+    position = np.full((len(runs), length), np.nan)
+    velocity = np.full((len(runs), length), np.nan)
+
+    tasks = [(float(run["acceleration"]), int(n), dt) for run, n in zip(runs, steps)]
+    if workers == 1 or len(tasks) <= 1:
+        results = map(_simulate_run, tasks)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        chunksize = max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))
+        results = pool.map(_simulate_run, tasks, chunksize=chunksize)
+    try:
+        for i, (pos, vel) in enumerate(results):
+            position[i, :len(pos)] = pos
+            velocity[i, :len(vel)] = vel
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return {"time": np.arange(length) * dt, "position": position, "velocity": velocity}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--acceleration", nargs="+", type=float, default=[-20, -10, 0, 10, 20])
+    parser.add_argument("--duration", nargs="+", type=float, default=[5], help="seconds")
+    parser.add_argument("--dt", type=float, default=DT)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="glbb_sweep.npz")
+    args = parser.parse_args()
+
+    runs = parameter_grid(args.acceleration, args.duration)
+    started = time.perf_counter()
+    result = run_sweep(runs, args.dt, args.workers)
+    elapsed = time.perf_counter() - started
+
+    np.savez_compressed(args.out, dt=args.dt, **{name: runs[name] for name in runs.dtype.names},
+                        **result)
+    print(f"{len(runs)} runs x {len(result['time'])} samples in {elapsed:.1f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
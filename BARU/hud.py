@@ -0,0 +1,82 @@
+"""Cached text rendering for HUDs drawn onto pygame surfaces.
+
+Rasterizing text with `Font.render` is the slowest part of drawing a
+frame, yet HUD values rarely change between frames at the precision they
+are shown with. `TextCache` keeps recently rendered strings and `HUD`
+composes its lines into one overlay that is only rebuilt when a line
+actually changes.
+"""
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 256
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by string, font and color."""
+
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, font, tuple(color), antialias)
+        surface = self._cache.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = font.render(text, antialias, color)
+            self._cache[key] = surface
+            if len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        return surface
+
+    def clear(self):
+        self._cache.clear()
+
+
+# Shared by every HUD unless one is given its own
+text_cache = TextCache()
+
+
+class HUD:
+    """Lines of text drawn as a single pre-composed overlay.
+
+    `draw` blits the overlay and only re-composes it (from cached line
+    surfaces) when the given lines differ from the previous frame's.
+    """
+
+    def __init__(self, font, color=(0, 0, 0), position=(10, 10), line_height=25, cache=None):
+        self.font = font
+        self.color = color
+        self.position = position
+        self.line_height = line_height
+        self.cache = cache or text_cache
+        self._lines = None
+        self._overlay = None
+
+    def _compose(self, lines):
+        surfaces = [self.cache.render(self.font, line, self.color) for line in lines]
+        width, height = 1, 1
+        if surfaces:
+            width = max(surface.get_width() for surface in surfaces)
+            height = self.line_height * (len(surfaces) - 1) + surfaces[-1].get_height()
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, surface in enumerate(surfaces):
+            # Lines never overlap, so MAX onto a transparent overlay copies
+            # each one exactly instead of blending it against black
+            overlay.blit(surface, (0, i * self.line_height), special_flags=pygame.BLEND_RGBA_MAX)
+        return overlay
+
+    def draw(self, target, lines):
+        """Blit ``lines`` onto ``target``; returns the rect covered."""
+        lines = tuple(lines)
+        if lines != self._lines:
+            self._overlay = self._compose(lines)
+            self._lines = lines
+        return target.blit(self._overlay, self.position)
@@ -0,0 +1,140 @@
+"""Frame-time instrumentation and an on-screen performance overlay.
+
+`PerfStats` keeps the last few hundred durations of each named stage of a
+frame (physics step, draw, display, ...) plus the interval between frames.
+Recording is one `time.perf_counter_ns` pair and a deque append per stage,
+cheap enough to leave on permanently, so the numbers are already there
+when a stutter is noticed and the overlay is switched on.
+
+`PerfOverlay` draws those stats through any `render` backend: p50/p95/p99
+per stage and a histogram of recent frame times against the frame budget.
+"""
+import time
+from collections import deque
+
+PERF_WINDOW = 240         # samples kept per stage, ~4 s at 60 FPS
+HISTOGRAM_BINS = 24
+REFRESH_INTERVAL = 0.25   # seconds between overlay text/histogram updates
+
+FRAME = "frame"
+
+
+def percentiles(samples, points=(50, 95, 99)):
+    """Nearest-rank percentiles of ``samples``; zeros when there are none."""
+    if not samples:
+        return [0] * len(points)
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return [ordered[min(last, int(len(ordered) * p / 100))] for p in points]
+
+
+class PerfStats:
+    def __init__(self, window=PERF_WINDOW):
+        self.window = window
+        self.stages = {}
+        self._last_frame = None
+
+    def add(self, stage, ns):
+        """Record one duration of ``stage``, in nanoseconds."""
+        samples = self.stages.get(stage)
+        if samples is None:
+            samples = self.stages[stage] = deque(maxlen=self.window)
+        samples.append(ns)
+
+    def frame(self):
+        """Mark the start of a frame; records the interval since the last one."""
+        now = time.perf_counter_ns()
+        if self._last_frame is not None:
+            self.add(FRAME, now - self._last_frame)
+        self._last_frame = now
+
+    def resume(self):
+        """Forget the last frame mark, so a deliberate pause (idle, hidden)
+        is not counted as one very long frame."""
+        self._last_frame = None
+
+    def summary(self, stage):
+        """(p50, p95, p99) of ``stage`` in milliseconds."""
+        return [ns / 1e6 for ns in percentiles(self.stages.get(stage, ()))]
+
+    def histogram(self, stage, upper_ms, bins=HISTOGRAM_BINS):
+        """Counts of ``stage`` durations in ``bins`` equal bins up to
+        ``upper_ms``; longer ones land in the last bin."""
+        counts = [0] * bins
+        scale = bins / (upper_ms * 1e6)
+        for ns in self.stages.get(stage, ()):
+            counts[min(bins - 1, int(ns * scale))] += 1
+        return counts
+
+    def clear(self):
+        self.stages.clear()
+        self._last_frame = None
+
+
+class PerfOverlay:
+    """Stats box drawn with a render backend's polygon, text and line calls.
+
+    Text and histogram are recomputed at most every ``refresh`` seconds,
+    which keeps the overlay cheap and its numbers readable.
+    """
+
+    def __init__(self, stats, stages, position=(10, 10), width=300, line_height=16,
+                 budget_ms=1000 / 60, histogram_height=48, refresh=REFRESH_INTERVAL):
+        self.stats = stats
+        self.stages = list(stages)
+        self.position = position
+        self.width = width
+        self.line_height = line_height
+        self.budget_ms = budget_ms
+        self.histogram_height = histogram_height
+        self.refresh = refresh
+        self._lines = []
+        self._counts = []
+        self._upper_ms = 2 * budget_ms
+        self._updated = None
+
+    @property
+    def rect(self):
+        """(x, y, width, height) covered by the overlay."""
+        lines = len(self.stages) + 3
+        return (*self.position, self.width,
+                lines * self.line_height + self.histogram_height + 12)
+
+    def update(self):
+        frame = self.stats.summary(FRAME)
+        fps = 1000 / frame[0] if frame[0] else 0.0
+        lines = [f"FPS {fps:5.1f}", f"{'ms':<8}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for stage in [FRAME] + self.stages:
+            p50, p95, p99 = self.stats.summary(stage)
+            lines.append(f"{stage:<8}{p50:8.2f}{p95:8.2f}{p99:8.2f}")
+        self._lines = lines
+        # Range covers twice the budget, or further if the slowest frames do
+        self._upper_ms = max(2 * self.budget_ms, frame[2] * 1.1)
+        self._counts = self.stats.histogram(FRAME, self._upper_ms)
+
+    def render(self, backend):
+        now = time.perf_counter()
+        if self._updated is None or now - self._updated >= self.refresh:
+            self.update()
+            self._updated = now
+
+        x, y, width, height = self.rect
+        backend.polygon([(x, y), (x + width, y), (x + width, y + height), (x, y + height)],
+                        (24, 24, 32))
+        backend.text(self._lines, (x + 6, y + 4), (230, 230, 230), self.line_height)
+
+        # Frame-time histogram; bars past the budget line are red
+        left = x + 6
+        bottom = y + height - 4
+        bin_width = (width - 12) / max(len(self._counts), 1)
+        peak = max(self._counts, default=0) or 1
+        for i, count in enumerate(self._counts):
+            if not count:
+                continue
+            top = bottom - self.histogram_height * count / peak
+            over = i * self._upper_ms / len(self._counts) >= self.budget_ms
+            bar_left, bar_right = left + i * bin_width, left + (i + 1) * bin_width - 1
+            backend.polygon([(bar_left, top), (bar_right, top), (bar_right, bottom), (bar_left, bottom)],
+                            (220, 80, 70) if over else (90, 200, 120))
+        budget_x = left + (width - 12) * self.budget_ms / self._upper_ms
+        backend.line((budget_x, bottom - self.histogram_height), (budget_x, bottom), (240, 220, 90))
@@ -0,0 +1,87 @@
+"""Process-wide quiz question bank.
+
+`question_bank(path)` returns the one `QuestionBank` for a CSV file. The
+file is parsed once into compact `Question` records, indexed by id and by
+topic, and only parsed again when its modification time or size changes.
+
+The CSV needs the columns ``soal,a,b,c,d,correct``. Optional ``id`` and
+``topik`` columns name each question and group it; without them the id
+is the 1-based row number and every question has the topic ``""``. Ids
+are always strings; `get` accepts ``1`` as well as ``"1"``.
+"""
+import csv
+import random
+from array import array
+from collections import namedtuple
+
+from filecache import FileBacked, shared
+
+Question = namedtuple("Question", "id topic soal a b c d correct")
+
+REQUIRED_COLUMNS = ("soal", "a", "b", "c", "d", "correct")
+
+
+class QuestionBank(FileBacked):
+    def __init__(self, path):
+        super().__init__(path)
+        self.records = []
+        self.by_id = {}
+        self.by_topic = {}
+
+    def _load(self):
+        records = []
+        by_id = {}
+        by_topic = {}
+        with open(self.path, mode='r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            header = [name.strip() for name in next(reader, [])]
+            missing = [name for name in REQUIRED_COLUMNS if name not in header]
+            if missing:
+                raise ValueError(f"{self.path} is missing columns: {', '.join(missing)}")
+            fields = [header.index(name) for name in REQUIRED_COLUMNS]
+            id_column = header.index("id") if "id" in header else None
+            topic_column = header.index("topik") if "topik" in header else None
+
+            for number, row in enumerate(reader, start=1):
+                if not row:
+                    continue
+                if len(row) < len(header):
+                    row += [""] * (len(header) - len(row))
+                question_id = row[id_column].strip() if id_column is not None else str(number)
+                topic = row[topic_column] if topic_column is not None else ""
+                index = len(records)
+                records.append(Question(question_id, topic, *(row[i] for i in fields)))
+                by_id[question_id] = index
+                if topic not in by_topic:
+                    by_topic[topic] = array("l")
+                by_topic[topic].append(index)
+        self.records, self.by_id, self.by_topic = records, by_id, by_topic
+
+    def __len__(self):
+        return len(self.records)
+
+    def topics(self):
+        return list(self.by_topic)
+
+    def get(self, question_id):
+        return self.records[self.by_id[str(question_id)]]
+
+    def questions(self, topic=None):
+        """All questions in file order, or those of ``topic``."""
+        if topic is None:
+            return self.records
+        return [self.records[i] for i in self.by_topic.get(topic, ())]
+
+    def sample(self, k, topic=None, rng=random):
+        """``k`` distinct random questions (fewer if there are not enough).
+
+        Only the chosen records are touched; the population is a range or
+        the topic's index array, never a copied list of questions.
+        """
+        population = range(len(self.records)) if topic is None else self.by_topic.get(topic, ())
+        return [self.records[i] for i in rng.sample(population, min(k, len(population)))]
+
+
+def question_bank(path):
+    """The shared, up-to-date `QuestionBank` for ``path``."""
+    return shared(QuestionBank, path)
@@ -0,0 +1,194 @@
+"""Compact binary session recordings with memory-mapped, seekable replay.
+
+A recording is a short JSON header followed by fixed-width records of one
+NumPy structured dtype. Every dtype has a ``kind`` and a ``step`` field and
+records are written in step order. ``EVENT`` records hold inputs and
+``KEYFRAME`` records hold a full state snapshot; a simulation may use
+extra kinds for the rows that follow its keyframe header.
+
+Replay memory-maps the file, restores the nearest keyframe before the
+requested step and only steps the physics forward from there.
+"""
+import json
+import os
+
+import numpy as np
+
+MAGIC = b"PHYSIMRC"
+EVENT = 1
+KEYFRAME = 2
+PAYLOAD = 3
+
+KEYFRAME_INTERVAL = 60  # physics steps between keyframes
+
+
+def write_header(file, magic, header):
+    """Write ``magic``, the JSON ``header``'s length and the header itself,
+    padded so whatever follows starts 8-byte aligned."""
+    data = json.dumps(header).encode("utf-8")
+    data += b" " * (-(len(magic) + 4 + len(data)) % 8)
+    file.write(magic + len(data).to_bytes(4, "little") + data)
+
+
+def read_header(file, magic):
+    """Read a header written by `write_header`; returns (header, data offset)."""
+    if file.read(len(magic)) != magic:
+        raise ValueError(f"{file.name} does not start with {magic.decode()}")
+    header_len = int.from_bytes(file.read(4), "little")
+    header = json.loads(file.read(header_len).decode("utf-8"))
+    return header, len(magic) + 4 + header_len
+
+
+class SessionWriter:
+    def __init__(self, path, dtype, meta=None, buffer_records=4096):
+        self.dtype = np.dtype(dtype)
+        self._file = open(path, "wb")
+        write_header(self._file, MAGIC, {"dtype": self.dtype.descr, "meta": meta or {}})
+        self._buffer = np.zeros(buffer_records, dtype=self.dtype)
+        self._blank = np.zeros((), dtype=self.dtype)
+        self._pending = 0
+
+    def record(self, **fields):
+        """Append one record; fields not given are zero."""
+        if self._pending == len(self._buffer):
+            self.flush()
+        self._buffer[self._pending] = self._blank
+        row = self._buffer[self._pending]
+        for name, value in fields.items():
+            row[name] = value
+        self._pending += 1
+
+    def write(self, records):
+        """Append a structured array of records in one go."""
+        self.flush()
+        np.asarray(records, dtype=self.dtype).tofile(self._file)
+
+    def flush(self):
+        if self._pending:
+            self._buffer[:self._pending].tofile(self._file)
+            self._pending = 0
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SessionReader:
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            try:
+                header, offset = read_header(file, MAGIC)
+            except ValueError:
+                raise ValueError(f"{path} is not a simulation recording") from None
+        self.dtype = np.dtype([tuple(field) for field in header["dtype"]])
+        self.meta = header["meta"]
+
+        # A partially written last record (e.g. after a crash) is ignored
+        count = (os.path.getsize(path) - offset) // self.dtype.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=self.dtype, mode="r", offset=offset, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+        self.steps = self.records["step"]
+        self.keyframes = np.flatnonzero(self.records["kind"] == KEYFRAME)
+        self._keyframe_steps = self.steps[self.keyframes]
+        self._event_steps = self.steps[self.records["kind"] == EVENT]
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def last_step(self):
+        return int(self.steps[-1]) if len(self.records) else 0
+
+    def keyframe_before(self, step):
+        """Record index of the latest keyframe at or before ``step``, or None."""
+        k = np.searchsorted(self._keyframe_steps, step, side="right") - 1
+        return int(self.keyframes[k]) if k >= 0 else None
+
+    def next_event_step(self, step):
+        """Step of the first event after ``step``, or None."""
+        k = np.searchsorted(self._event_steps, step, side="right")
+        return int(self._event_steps[k]) if k < len(self._event_steps) else None
+
+    def end_of_step(self, step, start=0):
+        """Index just past the last record of ``step``, searching from ``start``."""
+        return start + int(np.searchsorted(self.steps[start:], step, side="right"))
+
+
+class Replay:
+    """Seekable playback of a recording.
+
+    Subclasses implement `restore` (load the keyframe at a record index and
+    return the index after its rows), `apply` (one event record) and
+    `advance` (one physics step). Simulations that can jump several steps
+    at once override `advance_many`; seeking only stops at event steps.
+    Subclasses also set `kind` to the ``simulation`` name their recorder
+    writes into the header, so another simulation's file is rejected.
+    """
+
+    kind = None
+
+    def __init__(self, path):
+        self.reader = SessionReader(path)
+        recorded = self.reader.meta.get("simulation")
+        if self.kind is not None and recorded != self.kind:
+            raise ValueError(f"{path} is a {recorded} recording, not {self.kind}")
+        if not len(self.reader.keyframes):
+            raise ValueError(f"{path} has no keyframes")
+        self.step = None
+        self._cursor = 0
+
+    @property
+    def length(self):
+        return self.reader.last_step
+
+    def restore(self, index):
+        raise NotImplementedError
+
+    def apply(self, event):
+        raise NotImplementedError
+
+    def advance(self):
+        raise NotImplementedError
+
+    def advance_many(self, steps):
+        for _ in range(steps):
+            self.advance()
+
+    def _apply_events(self):
+        """Apply the events of the current step that come after the cursor."""
+        reader = self.reader
+        end = reader.end_of_step(self.step, self._cursor)
+        chunk = reader.records[self._cursor:end]
+        for event in chunk[chunk["kind"] == EVENT]:
+            self.apply(event)
+        self._cursor = end
+
+    def seek(self, target):
+        """Go to ``target`` (clamped to the recording); the state at a step
+        includes the events recorded for that step."""
+        reader = self.reader
+        target = max(int(reader._keyframe_steps[0]), min(int(target), self.length))
+        index = reader.keyframe_before(target)
+        keyframe_step = int(reader.steps[index])
+        if self.step is None or target < self.step or keyframe_step > self.step:
+            self._cursor = self.restore(index)
+            self.step = keyframe_step
+            self._apply_events()
+
+        while self.step < target:
+            stop = reader.next_event_step(self.step)
+            stop = target if stop is None else min(stop, target)
+            self.advance_many(stop - self.step)
+            self.step = stop
+            self._apply_events()
+        return self.step
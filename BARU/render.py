@@ -0,0 +1,108 @@
+"""Render backends for simulations that draw themselves.
+
+A simulation's ``render(backend)`` issues a handful of draw commands --
+fill, line, polygon, arrow, text -- and the backend decides how they
+reach the screen. `PygameBackend` draws onto a pygame surface for
+standalone windows; `QPainterBackend` paints straight into a Qt widget,
+so the GUI needs no pygame surface and no surface-to-Qt conversion.
+
+Coordinates are pixels with y pointing down; colors are RGB tuples.
+"""
+import math
+
+
+class RenderBackend:
+    def fill(self, color):
+        raise NotImplementedError
+
+    def line(self, start, end, color, width=1):
+        raise NotImplementedError
+
+    def polygon(self, points, color):
+        raise NotImplementedError
+
+    def text(self, lines, position, color, line_height):
+        """Draw ``lines`` top-left aligned, ``line_height`` pixels apart."""
+        raise NotImplementedError
+
+    def arrow(self, start, end, color, width=1, head=8):
+        """A line from ``start`` to ``end`` with two ``head``-long barbs."""
+        self.line(start, end, color, width)
+        dx, dy = end[0] - start[0], end[1] - start[1]
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return
+        ux, uy = dx / length, dy / length
+        for side in (-1, 1):
+            # Back along the shaft and out to the side by ``head`` each
+            barb = (end[0] - ux * head + uy * head * side, end[1] - uy * head - ux * head * side)
+            self.line(end, barb, color, width)
+
+
+class PygameBackend(RenderBackend):
+    def __init__(self, surface, font):
+        # Imported here so that the Qt path never loads pygame
+        import pygame
+        from hud import HUD
+
+        self._draw = pygame.draw
+        self._hud = HUD
+        self.surface = surface
+        self.font = font
+        self._huds = {}
+
+    def fill(self, color):
+        self.surface.fill(color)
+
+    def line(self, start, end, color, width=1):
+        self._draw.line(self.surface, color, start, end, width)
+
+    def polygon(self, points, color):
+        self._draw.polygon(self.surface, color, [(int(x), int(y)) for x, y in points])
+
+    def text(self, lines, position, color, line_height):
+        # One cached overlay per text block, rebuilt only when a line changes
+        key = (tuple(position), tuple(color), line_height)
+        hud = self._huds.get(key)
+        if hud is None:
+            hud = self._huds[key] = self._hud(self.font, color, position, line_height)
+        hud.draw(self.surface, lines)
+
+
+class QPainterBackend(RenderBackend):
+    """Paints with an active QPainter, e.g. inside a widget's paintEvent."""
+
+    def __init__(self, painter, font=None):
+        # Imported here so that headless and pygame users never load Qt
+        from PyQt5 import QtCore, QtGui
+
+        self._core = QtCore
+        self._gui = QtGui
+        self.painter = painter
+        self.font = font or QtGui.QFont("Arial")
+        if font is None:
+            self.font.setPixelSize(20)
+
+    def fill(self, color):
+        self.painter.fillRect(self.painter.viewport(), self._gui.QColor(*color))
+
+    def line(self, start, end, color, width=1):
+        Qt, QPointF = self._core.Qt, self._core.QPointF
+        self.painter.setPen(self._gui.QPen(self._gui.QColor(*color), width, Qt.SolidLine, Qt.RoundCap))
+        self.painter.drawLine(QPointF(*start), QPointF(*end))
+
+    def polygon(self, points, color):
+        Qt, QPointF = self._core.Qt, self._core.QPointF
+        self.painter.setPen(Qt.NoPen)
+        self.painter.setBrush(self._gui.QBrush(self._gui.QColor(*color)))
+        self.painter.drawPolygon(self._gui.QPolygonF([QPointF(x, y) for x, y in points]))
+        self.painter.setBrush(Qt.NoBrush)
+
+    def text(self, lines, position, color, line_height):
+        self.painter.setFont(self.font)
+        self.painter.setPen(self._gui.QColor(*color))
+        ascent = self._gui.QFontMetrics(self.font).ascent()
+        QPointF = self._core.QPointF
+        x, y = position
+        for i, line in enumerate(lines):
+            self.painter.drawText(QPointF(x, y + i * line_height + ascent), line)
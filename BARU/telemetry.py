@@ -0,0 +1,164 @@
+"""Per-step telemetry export on a background thread.
+
+A running simulation hands rows of numbers to `TelemetryWriter.write`,
+which only puts them on a bounded queue; a writer thread batches them and
+does the disk I/O, so the simulation tick never waits on the file. If the
+queue is full the rows are dropped (and counted) rather than blocking.
+A failed disk write does not raise either: it is kept in `error`, and
+that row and every later one is counted in `dropped` instead of written.
+Callers check both while running or after `close`.
+
+Two formats, picked from the file extension:
+
+* ``.csv`` -- a header line with the column names, one line per row.
+* anything else -- compact binary columnar blocks: a JSON header like
+  `recording`'s, then per batch a row count followed by each column as
+  contiguous little-endian float64 values. `read_telemetry` loads either.
+"""
+import atexit
+import queue
+import threading
+import time
+
+import numpy as np
+
+from recording import read_header, write_header
+
+MAGIC = b"PHYSIMTL"
+
+QUEUE_SIZE = 8192       # pending writes (rows or row blocks) before dropping
+BATCH_ROWS = 4096       # rows per disk write
+FLUSH_INTERVAL = 0.5    # seconds; partial batches are written at least this often
+
+_STOP = object()
+
+
+class TelemetryWriter:
+    def __init__(self, path, columns, batch_rows=BATCH_ROWS, flush_interval=FLUSH_INTERVAL,
+                 queue_size=QUEUE_SIZE):
+        self.path = path
+        self.columns = list(columns)
+        self.csv = str(path).lower().endswith(".csv")
+        self.batch_rows = batch_rows
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.rows_written = 0
+        self.error = None
+
+        self._file = open(path, "w" if self.csv else "wb")
+        if self.csv:
+            self._file.write(",".join(self.columns) + "\n")
+        else:
+            write_header(self._file, MAGIC, {"columns": self.columns, "dtype": "<f8"})
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+        # The thread is a daemon so it never holds up exit; flush it first
+        atexit.register(self.close)
+
+    def write(self, row):
+        """Queue one row (values in column order); never blocks."""
+        self._put((row,))
+
+    def write_many(self, rows):
+        """Queue a 2-D array of rows at once, e.g. every ship of a step."""
+        if len(rows):
+            self._put(np.array(rows, dtype=np.float64))
+
+    def _put(self, item):
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += len(item)
+
+    def _run(self):
+        pending = []
+        count = 0
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if item is not None:
+                pending.append(item)
+                count += len(item)
+            if pending and (count >= self.batch_rows
+                            or time.monotonic() - last_flush >= self.flush_interval):
+                self._flush(pending)
+                pending, count = [], 0
+                last_flush = time.monotonic()
+        self._flush(pending)
+
+    def _flush(self, pending):
+        if not pending:
+            return
+        if self.error is not None:
+            self.dropped += sum(len(item) for item in pending)
+            return
+        try:
+            block = np.concatenate([np.asarray(item, dtype=np.float64).reshape(-1, len(self.columns))
+                                    for item in pending])
+            if self.csv:
+                np.savetxt(self._file, block, delimiter=",", fmt="%.10g")
+            else:
+                self._file.write(len(block).to_bytes(4, "little"))
+                self._file.write(np.ascontiguousarray(block.T, dtype="<f8").tobytes())
+            self._file.flush()
+        except (OSError, ValueError) as e:
+            self.error = e
+            self.dropped += sum(len(item) for item in pending)
+            return
+        self.rows_written += len(block)
+
+    def close(self):
+        """Write everything still queued and close the file.
+
+        Never raises for a failed write; see `error` and `dropped`.
+        """
+        if self._file.closed:
+            return
+        atexit.unregister(self.close)
+        self._queue.put(_STOP)
+        self._thread.join()
+        try:
+            self._file.close()
+        except OSError as e:
+            self.error = self.error or e
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_telemetry(path):
+    """Load a telemetry file as a dict of column name -> float64 array."""
+    if str(path).lower().endswith(".csv"):
+        with open(path) as file:
+            columns = file.readline().strip().split(",")
+        data = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2).reshape(-1, len(columns))
+        return {name: data[:, i] for i, name in enumerate(columns)}
+
+    with open(path, "rb") as file:
+        try:
+            columns = read_header(file, MAGIC)[0]["columns"]
+        except ValueError:
+            raise ValueError(f"{path} is not a telemetry file") from None
+        blocks = []
+        while True:
+            count = file.read(4)
+            if len(count) < 4:
+                break
+            n = int.from_bytes(count, "little")
+            size = n * len(columns) * 8
+            raw = file.read(size)
+            if len(raw) < size:
+                break  # cut short, e.g. by a crash
+            blocks.append(np.frombuffer(raw, dtype="<f8").reshape(len(columns), n))
+    data = np.concatenate(blocks, axis=1) if blocks else np.zeros((len(columns), 0))
+    return {name: data[i] for i, name in enumerate(columns)}
@@ -0,0 +1,298 @@
+"""Throughput benchmarks for the physics and render hot paths.
+
+Runs headless (SDL dummy video driver, Qt offscreen platform) and reports
+calls/sec and per-call latency percentiles for each benchmark::
+
+    python benchmarks/bench.py                      # run everything
+    python benchmarks/bench.py -k ship --quick      # subset, shorter runs
+    python benchmarks/bench.py --save base.json     # store a baseline
+    python benchmarks/bench.py --compare base.json  # exit 1 on regressions
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "simulation", "Gravity"))
+sys.path.insert(0, os.path.join(ROOT, "BARU"))
+
+import numpy as np  # noqa: E402
+
+SHIP_COUNTS = (1, 10, 100, 1000, 10000, 100000)
+OBJECT_SHIP_COUNTS = (1, 10, 100, 1000)
+REGRESSION_THRESHOLD = 0.20
+
+
+def measure(fn, min_time=1.0, min_calls=20, max_calls=100000):
+    """Call ``fn`` repeatedly and return the per-call latencies in seconds."""
+    samples = []
+    clock = time.perf_counter_ns
+    deadline = clock() + int(min_time * 1e9)
+    while len(samples) < max_calls and (len(samples) < min_calls or clock() < deadline):
+        start = clock()
+        fn()
+        samples.append(clock() - start)
+    return np.array(samples) / 1e9
+
+
+def summarize(latencies, items=1):
+    total = latencies.sum()
+    p50, p95, p99 = np.percentile(latencies, (50, 95, 99))
+    return {
+        "calls": len(latencies),
+        "per_sec": len(latencies) / total,
+        "items_per_sec": items * len(latencies) / total,
+        "p50_us": p50 * 1e6,
+        "p95_us": p95 * 1e6,
+        "p99_us": p99 * 1e6,
+    }
+
+
+def _ship_launches(n, seed=0):
+    rng = np.random.default_rng(seed)
+    # A ring around the planet so ships orbit instead of leaving immediately
+    angle = rng.uniform(0, 2 * np.pi, n)
+    radius = rng.uniform(80, 250, n)
+    pos = np.stack((400 + radius * np.cos(angle), 300 + radius * np.sin(angle)), axis=1)
+    speed = np.sqrt(5 * 100 / radius)
+    vel = np.stack((-speed * np.sin(angle), speed * np.cos(angle)), axis=1)
+    return pos, vel
+
+
+def bench_spacecraft_move(n):
+    from physics import Planet, Spacecraft
+
+    planet = Planet(400, 300, 100)
+    pos, vel = _ship_launches(n)
+    ships = [Spacecraft(x, y, vx, vy, 5) for (x, y), (vx, vy) in zip(pos.tolist(), vel.tolist())]
+
+    def run():
+        for ship in ships:
+            ship.move(planet)
+    return run
+
+
+def bench_ship_store_move(n):
+    from physics import Planet, ShipStore
+
+    planet = Planet(400, 300, 100)
+    pos, vel = _ship_launches(n)
+    ships = ShipStore(capacity=n)
+    ships.add_many(pos, vel, 5)
+
+    def run():
+        ships.move(planet)
+    return run
+
+
+def bench_ship_store_barnes_hut(n):
+    from physics import Planet, ShipStore
+
+    planet = Planet(400, 300, 100)
+    pos, vel = _ship_launches(n)
+    ships = ShipStore(capacity=n, ship_gravity=True)
+    ships.add_many(pos, vel, 5)
+
+    def run():
+        ships.move(planet)
+    return run
+
+
+def _glbb():
+    import pygame
+    pygame.init()
+    from glbb import GLBBSimulation
+    sim = GLBBSimulation(width=800, height=400)
+    sim.set_acceleration(12.5)
+    return sim
+
+
+def bench_glbb_construct():
+    from glbb import GLBBSimulation
+
+    def run():
+        GLBBSimulation(width=800, height=400)
+    return run
+
+
+def bench_glbb_step():
+    sim = _glbb()
+
+    def run():
+        sim.step()
+        if sim.box_body.position.x > sim.width - 40:
+            sim.reset()
+            sim.set_acceleration(12.5)
+    return run
+
+
+def bench_glbb_advance():
+    sim = _glbb()
+
+    def run():
+        # Ten minutes of simulated time at 60 Hz
+        sim.reset()
+        sim.set_acceleration(12.5)
+        sim.advance(36000)
+    return run
+
+
+def bench_glbb_draw():
+    sim = _glbb()
+    sim.step()
+
+    def run():
+        sim.draw()
+    return run
+
+
+_qt_app = None
+
+
+def _qt_widget():
+    global _qt_app
+    from PyQt5.QtWidgets import QApplication
+    _qt_app = QApplication.instance() or QApplication([])
+    from pygame_embed import PygameEmbedWidget
+
+    sim = _glbb()
+    sim.draw()
+    return sim, PygameEmbedWidget(sim, sim.width, sim.height)
+
+
+def bench_frame_to_qt_copy():
+    """The old per-frame path: tostring -> QImage -> QPixmap, then painted."""
+    import pygame
+    from PyQt5.QtGui import QImage, QPainter, QPixmap
+    sim, _ = _qt_widget()
+    target = QImage(sim.width, sim.height, QImage.Format_RGB32)
+
+    def run():
+        surface = sim.surface
+        raw_str = pygame.image.tostring(surface, "RGBA")
+        qimage = QImage(raw_str, surface.get_width(), surface.get_height(), QImage.Format_RGBA8888)
+        pixmap = QPixmap.fromImage(qimage)
+        painter = QPainter(target)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+    return run
+
+
+def bench_frame_to_qt_bridge():
+    """PygameEmbedWidget: update_display plus the paintEvent it triggers."""
+    from PyQt5.QtGui import QImage
+    sim, widget = _qt_widget()
+    target = QImage(sim.width, sim.height, QImage.Format_RGB32)
+
+    def run():
+        widget.update_display()
+        widget.render(target)
+    return run
+
+
+def bench_frame_to_qt_qpainter():
+    """SimulationWidget: the simulation's draw commands painted by QPainter."""
+    from PyQt5.QtGui import QImage
+    _qt_widget()
+    from coba import SimulationWidget
+
+    sim = _glbb()
+    widget = SimulationWidget(sim, sim.width, sim.height)
+    target = QImage(sim.width, sim.height, QImage.Format_RGB32)
+
+    def run():
+        widget.update_display()
+        widget.render(target)
+    return run
+
+
+def benchmarks():
+    """Name -> (factory, items per call)."""
+    table = {}
+    for n in OBJECT_SHIP_COUNTS:
+        table[f"spacecraft_move[{n}]"] = (lambda n=n: bench_spacecraft_move(n), n)
+    for n in SHIP_COUNTS:
+        table[f"ship_store_move[{n}]"] = (lambda n=n: bench_ship_store_move(n), n)
+    for n in SHIP_COUNTS[:-1]:
+        table[f"ship_store_barnes_hut[{n}]"] = (lambda n=n: bench_ship_store_barnes_hut(n), n)
+    table["glbb_construct"] = (bench_glbb_construct, 1)
+    table["glbb_step"] = (bench_glbb_step, 1)
+    table["glbb_advance[36000]"] = (bench_glbb_advance, 36000)
+    table["glbb_draw"] = (bench_glbb_draw, 1)
+    table["frame_to_qt[copy]"] = (bench_frame_to_qt_copy, 1)
+    table["frame_to_qt[bridge]"] = (bench_frame_to_qt_bridge, 1)
+    table["frame_to_qt[qpainter]"] = (bench_frame_to_qt_qpainter, 1)
+    return table
+
+
+def compare(results, baseline, threshold):
+    """Return the names whose median latency regressed past ``threshold``."""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            continue
+        change = result["p50_us"] / old["p50_us"] - 1
+        result["p50_change"] = change
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--quick", action="store_true", help="shorter runs")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per benchmark")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="allowed p50 slowdown before failing (0.2 = 20%%)")
+    args = parser.parse_args()
+    min_time = 0.2 if args.quick else args.min_time
+
+    results = {}
+    print(f"{'benchmark':32} {'calls/s':>12} {'items/s':>14} {'p50 us':>10} {'p95 us':>10} {'p99 us':>10}")
+    for name, (factory, items) in benchmarks().items():
+        if args.pattern not in name:
+            continue
+        run = factory()
+        run()  # warm-up
+        result = summarize(measure(run, min_time), items)
+        results[name] = result
+        print(f"{name:32} {result['per_sec']:12.1f} {result['items_per_sec']:14.0f} "
+              f"{result['p50_us']:10.1f} {result['p95_us']:10.1f} {result['p99_us']:10.1f}")
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for name, result in results.items():
+            if "p50_change" in result:
+                print(f"{name:32} p50 {result['p50_change']:+.1%}")
+        if regressions:
+            print("Regressions: " + ", ".join(regressions))
+            exit_code = 1
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": results,
+            }, file, indent=2)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
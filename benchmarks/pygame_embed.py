@@ -0,0 +1,52 @@
+"""The zero-copy pygame -> Qt bridge GL used before it painted with QPainter.
+
+Kept only for the ``frame_to_qt[bridge]`` benchmark in `bench`, as a
+baseline for `SimulationWidget`; the app itself no longer uses it.
+"""
+from PyQt5 import sip
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QWidget
+
+# pygame's 32-bit XRGB layout, which QImage.Format_RGB32 reads as-is
+RGB32_MASKS = (0xFF0000, 0x00FF00, 0x0000FF)
+
+
+class PygameEmbedWidget(QWidget):
+    """Shows the simulation surface without copying it each frame.
+
+    A persistent QImage is built directly over the surface's pixel buffer,
+    so `update_display` only schedules a repaint and `paintEvent` draws
+    whatever the surface holds at that moment. Surfaces in another pixel
+    format fall back to converting a copy per frame.
+    """
+
+    def __init__(self, simulation, width, height, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(width, height)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.simulation = simulation
+        self._surface = None
+        self._image = None
+
+    def _bridge(self, surface):
+        if surface is not self._surface:
+            self._surface = surface
+            self._image = None
+            if surface.get_bitsize() == 32 and surface.get_masks()[:3] == RGB32_MASKS:
+                # Shares the surface's memory; self._surface keeps it alive
+                self._image = QImage(sip.voidptr(surface._pixels_address), surface.get_width(),
+                                     surface.get_height(), surface.get_pitch(), QImage.Format_RGB32)
+        if self._image is not None:
+            return self._image
+        import pygame
+        raw_str = pygame.image.tostring(surface, "RGBA")
+        return QImage(raw_str, surface.get_width(), surface.get_height(), QImage.Format_RGBA8888).copy()
+
+    def update_display(self):
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._bridge(self.simulation.surface))
+        painter.end()
@@ -0,0 +1,15 @@
+"""Puts the GLBB app's directory (BARU) on ``sys.path``.
+
+The slingshot shares several modules with the GLBB app -- `recording`,
+`telemetry`, `perf`, `render` -- instead of keeping copies. Import this
+module before any of them::
+
+    import baru  # noqa: F401  (makes the BARU modules importable)
+"""
+import os
+import sys
+
+BARU_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "BARU"))
+
+if BARU_DIR not in sys.path:
+    sys.path.append(BARU_DIR)
@@ -0,0 +1,194 @@
+import numpy as np
+
+MAX_DEPTH = 20
+
+
+def direct_accelerations(targets, src_pos, src_mass, g, softening=0.0):
+    """Exact O(n * m) pairwise gravity on ``targets`` from every source.
+
+    Coincident target/source pairs (a body acting on itself) contribute
+    nothing. Work is chunked so memory stays bounded for large n.
+    """
+    targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+    acc = np.zeros_like(targets)
+    if len(src_mass) == 0:
+        return acc
+    eps2 = softening * softening
+    chunk = max(1, 2_000_000 // len(src_mass))
+    for start in range(0, len(targets), chunk):
+        block = targets[start:start + chunk]
+        dx = src_pos[:, 0] - block[:, 0, None]
+        dy = src_pos[:, 1] - block[:, 1, None]
+        dist_sq = dx * dx + dy * dy
+        soft_sq = dist_sq + eps2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(dist_sq > 0, src_mass / (soft_sq * np.sqrt(soft_sq)), 0.0)
+        acc[start:start + chunk, 0] = g * np.einsum("ij,ij->i", scale, dx)
+        acc[start:start + chunk, 1] = g * np.einsum("ij,ij->i", scale, dy)
+    return acc
+
+
+def _spread_bits(v):
+    v = v.astype(np.uint64)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x3333333333333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x5555555555555555)
+    return v
+
+
+def _concat_ranges(starts, ends):
+    lengths = ends - starts
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(starts, lengths) + offsets
+
+
+class QuadTree:
+    """Barnes–Hut quadtree over point masses.
+
+    Bodies are sorted by Morton code so every node covers a contiguous
+    range ``[start, end)`` of the sorted bodies, and the tree is built one
+    level at a time with array operations instead of per-body insertion.
+    """
+
+    def __init__(self, pos, mass, max_depth=MAX_DEPTH):
+        self.src_pos = np.asarray(pos, dtype=float).reshape(-1, 2)
+        self.src_mass = np.asarray(mass, dtype=float)
+        n = len(self.src_mass)
+
+        lo = self.src_pos.min(axis=0) if n else np.zeros(2)
+        hi = self.src_pos.max(axis=0) if n else np.ones(2)
+        root_size = float((hi - lo).max()) or 1.0
+        root_size *= 1.0 + 1e-9
+
+        grid = 1 << max_depth
+        cells = ((self.src_pos - lo) / root_size * grid).astype(np.int64)
+        cells = np.clip(cells, 0, grid - 1)
+        codes = _spread_bits(cells[:, 0]) | (_spread_bits(cells[:, 1]) << np.uint64(1))
+
+        order = np.argsort(codes, kind="stable")
+        self.rank = np.empty(n, dtype=np.int64)
+        self.rank[order] = np.arange(n)
+        codes = codes[order]
+        m = self.src_mass[order]
+        p = self.src_pos[order]
+        cum_m = np.concatenate(([0.0], np.cumsum(m)))
+        cum_mx = np.concatenate(([0.0], np.cumsum(m * p[:, 0])))
+        cum_my = np.concatenate(([0.0], np.cumsum(m * p[:, 1])))
+
+        starts, ends = [], []
+        sizes, leaves = [], []
+        child_start, child_count = [], []
+        level_start = np.array([0])
+        level_end = np.array([n])
+        total = 0
+        for level in range(max_depth + 1):
+            count = level_end - level_start
+            leaf = (count <= 1) | (level == max_depth)
+            starts.append(level_start)
+            ends.append(level_end)
+            sizes.append(np.full(len(level_start), root_size / (1 << level)))
+            leaves.append(leaf)
+            total += len(level_start)
+            first_child = np.zeros(len(level_start), dtype=np.int64)
+            n_children = np.zeros(len(level_start), dtype=np.int64)
+            child_start.append(first_child)
+            child_count.append(n_children)
+
+            inner = ~leaf
+            if not inner.any():
+                break
+            s, e = level_start[inner], level_end[inner]
+            members = _concat_ranges(s, e)
+            prefix = codes[members] >> np.uint64(2 * (max_depth - level - 1))
+            breaks = np.flatnonzero(prefix[1:] != prefix[:-1]) + 1
+            run_start = np.concatenate(([0], breaks))
+            run_end = np.concatenate((breaks, [len(members)]))
+            next_start = members[run_start]
+            next_end = members[run_end - 1] + 1
+
+            lo_idx = np.searchsorted(next_start, s)
+            hi_idx = np.searchsorted(next_start, e)
+            first_child[inner] = total + lo_idx
+            n_children[inner] = hi_idx - lo_idx
+            level_start, level_end = next_start, next_end
+
+        self.start = np.concatenate(starts)
+        self.end = np.concatenate(ends)
+        self.size = np.concatenate(sizes)
+        self.leaf = np.concatenate(leaves)
+        self.child_start = np.concatenate(child_start)
+        self.child_count = np.concatenate(child_count)
+
+        self.mass = cum_m[self.end] - cum_m[self.start]
+        safe = np.where(self.mass > 0, self.mass, 1.0)
+        self.com = np.stack((
+            (cum_mx[self.end] - cum_mx[self.start]) / safe,
+            (cum_my[self.end] - cum_my[self.start]) / safe,
+        ), axis=1)
+        if n:
+            empty = self.mass <= 0
+            self.com[empty] = p[np.minimum(self.start[empty], n - 1)]
+
+    def accelerations(self, targets, g, theta=0.5, softening=0.0, self_index=None):
+        """Approximate gravity on ``targets`` using the opening angle ``theta``.
+
+        ``self_index`` gives, for each target that is also a source in this
+        tree, its source index; that body's own mass is then excluded. Nodes
+        that contain the target are always opened.
+        """
+        targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+        n_targets = len(targets)
+        acc = np.zeros((n_targets, 2))
+        if n_targets == 0 or len(self.src_mass) == 0:
+            return acc
+
+        if self_index is None:
+            self_index = np.full(n_targets, -1, dtype=np.int64)
+            target_rank = self_index
+        else:
+            self_index = np.asarray(self_index, dtype=np.int64)
+            target_rank = self.rank[self_index]
+        theta_sq = theta * theta
+        eps2 = softening * softening
+
+        body = np.arange(n_targets)
+        node = np.zeros(n_targets, dtype=np.int64)
+        while len(body):
+            delta = self.com[node] - targets[body]
+            dist_sq = np.einsum("ij,ij->i", delta, delta)
+            rank = target_rank[body]
+            contains = (self.start[node] <= rank) & (rank < self.end[node])
+            leaf = self.leaf[node]
+            far = (self.size[node] ** 2 < theta_sq * dist_sq) & ~contains
+            use = far | leaf
+
+            ub = body[use]
+            un = node[use]
+            ud = delta[use]
+            um = self.mass[un]
+            own = contains[use]
+            if own.any():
+                # Leaf holding the target itself: take its mass back out
+                src = self_index[ub[own]]
+                own_mass = self.src_mass[src]
+                rest = um[own] - own_mass
+                safe = np.where(rest > 0, rest, 1.0)
+                com = (self.com[un[own]] * um[own][:, None]
+                       - self.src_pos[src] * own_mass[:, None]) / safe[:, None]
+                ud[own] = com - targets[ub[own]]
+                um[own] = np.maximum(rest, 0.0)
+
+            dist_sq = np.einsum("ij,ij->i", ud, ud)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scale = np.where(dist_sq > 0, g * um / (dist_sq + eps2) ** 1.5, 0.0)
+            acc[:, 0] += np.bincount(ub, weights=ud[:, 0] * scale, minlength=n_targets)
+            acc[:, 1] += np.bincount(ub, weights=ud[:, 1] * scale, minlength=n_targets)
+
+            opened = ~use
+            ob, on = body[opened], node[opened]
+            counts = self.child_count[on]
+            body = np.repeat(ob, counts)
+            node = _concat_ranges(self.child_start[on], self.child_start[on] + counts)
+        return acc
@@ -0,0 +1,109 @@
+import numpy as np
+
+# Every integrator takes ``(pos, vel, dt, accel)`` with ``pos``/``vel`` as
+# (n, 2) arrays and returns the new ``(pos, vel)``. ``accel(pos, idx=None)``
+# returns the acceleration at ``pos``; ``idx`` names the ships ``pos`` holds
+# when it is only a subset of them.
+
+RK45_TOL = 1e-3
+RK45_MIN_FRACTION = 1e-3
+
+
+def semi_implicit_euler(pos, vel, dt, accel):
+    vel = vel + accel(pos) * dt
+    return pos + vel * dt, vel
+
+
+def velocity_verlet(pos, vel, dt, accel):
+    half = vel + accel(pos) * (dt / 2)
+    pos = pos + half * dt
+    return pos, half + accel(pos) * (dt / 2)
+
+
+def rk4(pos, vel, dt, accel):
+    a1 = accel(pos)
+    x2, v2 = pos + vel * (dt / 2), vel + a1 * (dt / 2)
+    a2 = accel(x2)
+    x3, v3 = pos + v2 * (dt / 2), vel + a2 * (dt / 2)
+    a3 = accel(x3)
+    x4, v4 = pos + v3 * dt, vel + a3 * dt
+    a4 = accel(x4)
+    new_pos = pos + (vel + 2 * v2 + 2 * v3 + v4) * (dt / 6)
+    new_vel = vel + (a1 + 2 * a2 + 2 * a3 + a4) * (dt / 6)
+    return new_pos, new_vel
+
+
+# Dormand–Prince 5(4) tableau
+_DP_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_B5 = (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0)
+_DP_B4 = (5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40)
+
+
+def rk45(pos, vel, dt, accel, tol=RK45_TOL):
+    """Adaptive Dormand–Prince step with its own step size per ship.
+
+    Every ship covers the full ``dt``, but ships whose error estimate is too
+    large (close passes) take several smaller substeps while the rest finish
+    in one. Only the ships still in progress are evaluated each iteration.
+    Substeps never go below ``dt * RK45_MIN_FRACTION`` and a step that small
+    is always accepted, so the loop ends after a bounded number of
+    iterations.
+    """
+    pos = np.array(pos, dtype=float)
+    vel = np.array(vel, dtype=float)
+    remaining = np.full(len(pos), float(dt))
+    step = np.full(len(pos), float(dt))
+    min_step = dt * RK45_MIN_FRACTION
+
+    while True:
+        active = np.flatnonzero(remaining > min_step * 1e-3)
+        if len(active) == 0:
+            break
+        h = np.minimum(step[active], remaining[active])
+        hc = h[:, None]
+        x0, v0 = pos[active], vel[active]
+
+        kx, kv = [], []
+        for a_row in _DP_A:
+            xi, vi = x0, v0
+            for coeff, dx, dv in zip(a_row, kx, kv):
+                if coeff:
+                    xi = xi + hc * coeff * dx
+                    vi = vi + hc * coeff * dv
+            kx.append(vi)
+            kv.append(accel(xi, active))
+
+        x5 = x0 + hc * sum(b * k for b, k in zip(_DP_B5, kx) if b)
+        v5 = v0 + hc * sum(b * k for b, k in zip(_DP_B5, kv) if b)
+        x4 = x0 + hc * sum(b * k for b, k in zip(_DP_B4, kx) if b)
+        v4 = v0 + hc * sum(b * k for b, k in zip(_DP_B4, kv) if b)
+
+        err = np.sqrt(np.einsum("ij,ij->i", x5 - x4, x5 - x4)
+                      + np.einsum("ij,ij->i", v5 - v4, v5 - v4)) / tol
+        ok = (err <= 1.0) | (h <= min_step)
+        done = active[ok]
+        pos[done] = x5[ok]
+        vel[done] = v5[ok]
+        remaining[done] -= h[ok]
+
+        with np.errstate(divide="ignore"):
+            factor = np.clip(0.9 * err ** -0.2, 0.2, 5.0)
+        step[active] = np.maximum(h * factor, min_step)
+    return pos, vel
+
+
+INTEGRATORS = {
+    "euler": semi_implicit_euler,
+    "verlet": velocity_verlet,
+    "rk4": rk4,
+    "rk45": rk45,
+}
@@ -0,0 +1,283 @@
+import math
+
+import numpy as np
+
+from gravity import QuadTree, direct_accelerations
+from integrators import INTEGRATORS
+
+WIDTH, HEIGHT = 800, 600
+
+PLANET_MASS = 100
+SHIP_MASS = 5
+G = 5
+PLANET_SIZE = 50
+OBJ_SIZE = 5
+VEL_SCALE = 100
+
+# Ship-ship attraction is off by default; planets always attract ships.
+SHIP_GRAVITY = False
+FORCE_METHOD = "barnes_hut"  # or "direct" for the exact O(n^2) sum
+THETA = 0.5
+SOFTENING = OBJ_SIZE
+
+# Simulation time is measured in steps of the original 60 FPS loop, so
+# velocities stay in pixels per 1/60 s whatever the frame rate is.
+TIME_UNIT = 1 / 60
+PHYSICS_DT = 1.0
+MAX_STEPS_PER_FRAME = 8
+INTEGRATOR = "euler"  # see integrators.INTEGRATORS
+
+TRAIL_LENGTH = 48  # samples kept per ship when trails are on
+
+
+class Planet:
+    def __init__(self, x, y, mass):
+        self.x = x
+        self.y = y
+        self.mass = mass
+
+
+# Planet layouts, selectable with the number keys in the window
+SCENES = {
+    1: [(WIDTH // 2, HEIGHT // 2, PLANET_MASS)],
+    2: [(WIDTH // 3, HEIGHT // 2, PLANET_MASS), (2 * WIDTH // 3, HEIGHT // 2, PLANET_MASS)],
+    3: [(WIDTH // 4, HEIGHT // 3, PLANET_MASS), (3 * WIDTH // 4, HEIGHT // 3, PLANET_MASS),
+        (WIDTH // 2, 3 * HEIGHT // 4, PLANET_MASS)],
+}
+
+
+def load_scene(number):
+    return [Planet(x, y, mass) for x, y, mass in SCENES[number]]
+
+
+def as_planets(planets):
+    """Accept a single `Planet` or any iterable of them."""
+    if isinstance(planets, Planet):
+        return [planets]
+    return list(planets)
+
+
+def planet_accelerations(pos, planets):
+    """Exact acceleration on each row of ``pos`` from every planet."""
+    acc = np.zeros_like(pos)
+    for planet in planets:
+        delta = np.array((planet.x, planet.y)) - pos
+        distance_sq = np.einsum("ij,ij->i", delta, delta)
+        acc += delta * (G * planet.mass / (distance_sq * np.sqrt(distance_sq)))[:, None]
+    return acc
+
+
+class Spacecraft:
+    def __init__(self, x, y, vel_x, vel_y, mass):
+        self.x = x
+        self.y = y
+        self.vel_x = vel_x
+        self.vel_y = vel_y
+        self.mass = mass
+
+    def move(self, planet=None, dt=PHYSICS_DT, integrator=INTEGRATOR):
+        planets = as_planets(planet)
+        if integrator == "euler":
+            # Scalar semi-implicit Euler; NumPy overhead dominates for one ship
+            for body in planets:
+                dx = body.x - self.x
+                dy = body.y - self.y
+                distance_sq = dx * dx + dy * dy
+                # G * M / d^2 along the unit vector (dx, dy) / d, without atan2/cos/sin
+                scale = G * body.mass / (distance_sq * math.sqrt(distance_sq))
+                self.vel_x += dx * scale * dt
+                self.vel_y += dy * scale * dt
+            self.x += self.vel_x * dt
+            self.y += self.vel_y * dt
+            return
+
+        pos, vel = INTEGRATORS[integrator](
+            np.array([[self.x, self.y]], dtype=float),
+            np.array([[self.vel_x, self.vel_y]], dtype=float),
+            dt,
+            lambda p, idx=None: planet_accelerations(p, planets),
+        )
+        self.x, self.y = pos[0].tolist()
+        self.vel_x, self.vel_y = vel[0].tolist()
+
+
+def create_ship(location, mouse):
+    t_x, t_y = location
+    m_x, m_y = mouse
+    vel_x = (m_x - t_x) / VEL_SCALE
+    vel_y = (m_y - t_y) / VEL_SCALE
+    obj = Spacecraft(t_x, t_y, vel_x, vel_y, SHIP_MASS)
+    return obj
+
+
+class ShipStore:
+    """All ships in flight, stored as parallel NumPy arrays.
+
+    Live ships occupy rows ``[0, count)``. Dead ships are removed by moving
+    live rows from the tail into the holes, so the order of ships is not
+    stable but removal costs O(dead) instead of O(n) per ship.
+    """
+
+    def __init__(self, capacity=1024, ship_gravity=SHIP_GRAVITY, method=FORCE_METHOD, theta=THETA,
+                 integrator=INTEGRATOR):
+        self.ship_gravity = ship_gravity
+        self.integrator = integrator
+        self.method = method
+        self.theta = theta
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.mass = np.zeros(capacity)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.count = 0
+        self._next_id = 0
+        self._columns = ["pos", "vel", "mass", "ids"]
+
+        # Optional trail history: a fixed (capacity, length, 2) ring shared by
+        # all ships, written at ``trail_head`` once per physics step.
+        self.trail = None
+        self.trail_age = None
+        self.trail_head = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def positions(self):
+        return self.pos[:self.count]
+
+    @property
+    def velocities(self):
+        return self.vel[:self.count]
+
+    def _reserve(self, extra):
+        needed = self.count + extra
+        capacity = len(self.mass)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in self._columns:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, ship):
+        """Append a `Spacecraft` and return the id assigned to it."""
+        return self.add_many([(ship.x, ship.y)], [(ship.vel_x, ship.vel_y)], [ship.mass])[0]
+
+    def add_many(self, pos, vel, mass, ids=None):
+        pos = np.asarray(pos, dtype=float).reshape(-1, 2)
+        k = len(pos)
+        self._reserve(k)
+        start, end = self.count, self.count + k
+        self.pos[start:end] = pos
+        self.vel[start:end] = np.asarray(vel, dtype=float).reshape(-1, 2)
+        self.mass[start:end] = mass
+        if ids is None:
+            ids = np.arange(self._next_id, self._next_id + k)
+        else:
+            ids = np.asarray(ids, dtype=np.int64)
+        self.ids[start:end] = ids
+        if self.trail is not None:
+            self.trail_age[start:end] = 0
+        if k:
+            self._next_id = max(self._next_id, int(ids.max()) + 1)
+        self.count = end
+        return ids
+
+    def _ship_accelerations(self, pos):
+        mass = self.mass[:self.count]
+        if self.method == "direct":
+            return direct_accelerations(pos, pos, mass, G, SOFTENING)
+        tree = QuadTree(pos, mass)
+        return tree.accelerations(pos, G, self.theta, SOFTENING, np.arange(self.count))
+
+    def field(self, planets):
+        """Return ``accel(pos, idx=None)`` for the integrators.
+
+        With ship gravity on, ``pos`` for a subset ``idx`` is merged into the
+        current positions so the other ships still act as sources.
+        """
+        planets = as_planets(planets)
+
+        def accel(pos, idx=None):
+            acc = planet_accelerations(pos, planets)
+            if self.ship_gravity and self.count > 1:
+                if idx is None:
+                    acc += self._ship_accelerations(pos)
+                else:
+                    full = self.pos[:self.count].copy()
+                    full[idx] = pos
+                    acc += self._ship_accelerations(full)[idx]
+            return acc
+
+        return accel
+
+    def accelerations(self, planets):
+        """Gravity on every live ship from the planets and, optionally, each other."""
+        return self.field(planets)(self.pos[:self.count])
+
+    def move(self, planets, dt=PHYSICS_DT):
+        """Advance every live ship by ``dt`` with the selected integrator."""
+        if self.count == 0:
+            return
+        n = self.count
+        self.pos[:n], self.vel[:n] = INTEGRATORS[self.integrator](
+            self.pos[:n], self.vel[:n], dt, self.field(planets))
+
+    def dead(self, planets, width=WIDTH, height=HEIGHT):
+        """Return ``(off_screen, collided)`` masks over the live ships."""
+        pos = self.pos[:self.count]
+        x, y = pos[:, 0], pos[:, 1]
+        off_screen = (x < 0) | (x > width) | (y < 0) | (y > height)
+        collided = np.zeros(self.count, dtype=bool)
+        for planet in as_planets(planets):
+            dx = x - planet.x
+            dy = y - planet.y
+            collided |= dx * dx + dy * dy <= PLANET_SIZE * PLANET_SIZE
+        return off_screen, collided
+
+    def compact(self, dead):
+        """Drop the ships flagged in ``dead`` by swapping tail ships into their rows."""
+        n = self.count
+        dead_idx = np.flatnonzero(dead)
+        if len(dead_idx) == 0:
+            return
+        new_count = n - len(dead_idx)
+        holes = dead_idx[dead_idx < new_count]
+        tail = np.arange(new_count, n)[~dead[new_count:n]]
+        for name in self._columns:
+            arr = getattr(self, name)
+            arr[holes] = arr[tail]
+        self.count = new_count
+
+    def enable_trails(self, length=TRAIL_LENGTH):
+        if self.trail is not None:
+            return
+        capacity = len(self.mass)
+        self.trail = np.zeros((capacity, length, 2), dtype=np.float32)
+        self.trail_age = np.zeros(capacity, dtype=np.int32)
+        self.trail_head = 0
+        self._columns += ["trail", "trail_age"]
+
+    def disable_trails(self):
+        if self.trail is None:
+            return
+        self._columns = [name for name in self._columns if name not in ("trail", "trail_age")]
+        self.trail = None
+        self.trail_age = None
+
+    def record_trail(self):
+        """Store the current positions as the newest trail sample."""
+        if self.trail is None:
+            return
+        length = self.trail.shape[1]
+        self.trail_head = (self.trail_head + 1) % length
+        self.trail[:self.count, self.trail_head] = self.pos[:self.count]
+        age = self.trail_age[:self.count]
+        np.minimum(age + 1, length, out=age)
+
+    def cull(self, planets, width=WIDTH, height=HEIGHT):
+        off_screen, collided = self.dead(planets, width, height)
+        self.compact(off_screen | collided)
@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from physics import PHYSICS_DT, INTEGRATOR, ShipStore, create_ship
+
+PREDICTION_STEPS = 1500
+PREDICTION_QUANTUM = 2  # pixels
+PREDICTION_BUDGET = 0.004  # seconds of prediction work per frame
+PREDICTION_CACHE_SIZE = 64
+
+
+class _Prediction:
+    def __init__(self, location, mouse, horizon, integrator):
+        self.ship = ShipStore(capacity=1, ship_gravity=False, integrator=integrator)
+        self.ship.add(create_ship(location, mouse))
+        self.points = np.zeros((horizon + 1, 2))
+        self.points[0] = location
+        self.count = 1
+        self.done = False
+
+
+class TrajectoryPredictor:
+    """Predicted path of the ship being aimed, using the `ShipStore` physics.
+
+    Paths are cached per quantized launch vector (and planet layout) and are
+    grown a little every frame within a time budget, so holding the mouse
+    still extends the same path instead of recomputing it. Other ships are
+    not taken into account.
+    """
+
+    def __init__(self, horizon=PREDICTION_STEPS, quantum=PREDICTION_QUANTUM,
+                 budget=PREDICTION_BUDGET, cache_size=PREDICTION_CACHE_SIZE):
+        self.horizon = horizon
+        self.quantum = quantum
+        self.budget = budget
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def _quantize(self, point):
+        q = self.quantum
+        return (round(point[0] / q) * q, round(point[1] / q) * q)
+
+    def path(self, location, mouse, planets, integrator=INTEGRATOR, dt=PHYSICS_DT):
+        """Return the predicted points so far as an (n, 2) array."""
+        location = self._quantize(location)
+        mouse = self._quantize(mouse)
+        layout = tuple((p.x, p.y, p.mass) for p in planets)
+        key = (location, mouse, layout, integrator, dt)
+
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = _Prediction(location, mouse, self.horizon, integrator)
+            self._cache[key] = entry
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        if not entry.done:
+            self._extend(entry, planets, dt)
+        return entry.points[:entry.count]
+
+    def _extend(self, entry, planets, dt):
+        deadline = time.perf_counter() + self.budget
+        ship = entry.ship
+        while entry.count <= self.horizon:
+            ship.move(planets, dt)
+            off_screen, collided = ship.dead(planets)
+            entry.points[entry.count] = ship.pos[0]
+            entry.count += 1
+            if off_screen[0] or collided[0]:
+                break
+            if time.perf_counter() > deadline:
+                return
+        entry.done = True
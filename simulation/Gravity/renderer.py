@@ -0,0 +1,46 @@
+import pygame
+
+# Past this many dirty rects a single full-screen blit/update is cheaper
+DIRTY_RECT_LIMIT = 300
+
+
+class DirtyRenderer:
+    """Redraws only the parts of the window that changed.
+
+    Every draw call of a frame goes through `mark` with the rect it
+    touched. At the start of the next frame only those rects get the
+    background restored, and `pygame.display.update` is passed last frame's
+    rects plus this frame's instead of the whole screen.
+    """
+
+    def __init__(self, win, background):
+        self.win = win
+        self.background = background
+        self._previous = []
+        self._current = []
+        self._full = True
+
+    def invalidate(self):
+        """Redraw and update the whole window on the next frame."""
+        self._full = True
+
+    def begin(self):
+        if self._full or len(self._previous) > DIRTY_RECT_LIMIT:
+            self._full = True
+            self.win.blit(self.background, (0, 0))
+        else:
+            for rect in self._previous:
+                self.win.blit(self.background, rect, rect)
+        self._current = []
+
+    def mark(self, rect):
+        self._current.append(rect)
+        return rect
+
+    def end(self):
+        if self._full or len(self._previous) + len(self._current) > DIRTY_RECT_LIMIT:
+            pygame.display.update()
+        else:
+            pygame.display.update(self._previous + self._current)
+        self._previous = self._current
+        self._full = False
@@ -0,0 +1,111 @@
+import numpy as np
+
+import baru  # noqa: F401  (the recording format is shared with the GLBB app)
+from physics import PHYSICS_DT, ShipStore, load_scene
+from integrators import INTEGRATORS
+from recording import EVENT, KEYFRAME, PAYLOAD, KEYFRAME_INTERVAL, Replay, SessionWriter
+
+RECORD_DTYPE = np.dtype([
+    ("kind", "u1"), ("code", "u1"), ("step", "u4"), ("id", "i8"),
+    ("x", "f8"), ("y", "f8"), ("vx", "f8"), ("vy", "f8"), ("mass", "f8"),
+])
+
+# Event codes; a launch uses id/x/y/vx/vy/mass, the others store their value in x
+LAUNCH, SCENE, SHIP_GRAVITY, METHOD, INTEGRATOR = 1, 2, 3, 4, 5
+
+METHODS = ("barnes_hut", "direct")
+INTEGRATOR_NAMES = tuple(INTEGRATORS)
+
+
+class SlingshotRecorder:
+    """Writes launches and setting changes, plus a keyframe of every ship
+    each ``keyframe_interval`` physics steps.
+
+    A keyframe is a header record (ship count in ``id``, scene and settings
+    in ``x``/``y``/``vx``/``vy``) followed by one ``PAYLOAD`` row per ship.
+    """
+
+    def __init__(self, path, dt=PHYSICS_DT, keyframe_interval=KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self.writer = SessionWriter(path, RECORD_DTYPE, {"simulation": "slingshot", "dt": dt})
+        self._started = False
+
+    def launch(self, step, ship_id, ship):
+        self.writer.record(kind=EVENT, code=LAUNCH, step=step, id=ship_id, x=ship.x, y=ship.y,
+                           vx=ship.vel_x, vy=ship.vel_y, mass=ship.mass)
+
+    def event(self, step, code, value):
+        self.writer.record(kind=EVENT, code=code, step=step, x=value)
+
+    def capture(self, step, ships, scene):
+        """Call before each physics step; writes a keyframe when one is due."""
+        if self._started and step % self.keyframe_interval:
+            return
+        self._started = True
+        n = ships.count
+        self.writer.record(kind=KEYFRAME, step=step, id=n, x=scene, y=float(ships.ship_gravity),
+                           vx=METHODS.index(ships.method), vy=INTEGRATOR_NAMES.index(ships.integrator))
+        rows = np.zeros(n, dtype=RECORD_DTYPE)
+        rows["kind"] = PAYLOAD
+        rows["step"] = step
+        rows["id"] = ships.ids[:n]
+        rows["x"], rows["y"] = ships.pos[:n, 0], ships.pos[:n, 1]
+        rows["vx"], rows["vy"] = ships.vel[:n, 0], ships.vel[:n, 1]
+        rows["mass"] = ships.mass[:n]
+        self.writer.write(rows)
+
+    def close(self, step, ships, scene):
+        self._started = False
+        self.capture(step, ships, scene)
+        self.writer.close()
+
+
+class SlingshotReplay(Replay):
+    """Plays a slingshot recording back into its own `ShipStore` and planets."""
+
+    kind = "slingshot"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.dt = self.reader.meta.get("dt", PHYSICS_DT)
+        self.ships = ShipStore()
+        self.scene = 1
+        self.planets = load_scene(self.scene)
+
+    def restore(self, index):
+        records = self.reader.records
+        head = records[index]
+        count = int(head["id"])
+        rows = records[index + 1:index + 1 + count]
+
+        trails = self.ships.trail is not None
+        self.ships = ShipStore(capacity=max(count, 1), ship_gravity=bool(head["y"]),
+                               method=METHODS[int(head["vx"])],
+                               integrator=INTEGRATOR_NAMES[int(head["vy"])])
+        if trails:
+            self.ships.enable_trails()
+        self.ships.add_many(np.stack((rows["x"], rows["y"]), axis=1),
+                            np.stack((rows["vx"], rows["vy"]), axis=1), rows["mass"], rows["id"])
+        self.scene = int(head["x"])
+        self.planets = load_scene(self.scene)
+        return index + 1 + count
+
+    def apply(self, event):
+        code = int(event["code"])
+        if code == LAUNCH:
+            self.ships.add_many([(event["x"], event["y"])], [(event["vx"], event["vy"])],
+                                [event["mass"]], [event["id"]])
+        elif code == SCENE:
+            self.scene = int(event["x"])
+            self.planets = load_scene(self.scene)
+        elif code == SHIP_GRAVITY:
+            self.ships.ship_gravity = bool(event["x"])
+        elif code == METHOD:
+            self.ships.method = METHODS[int(event["x"])]
+        elif code == INTEGRATOR:
+            self.ships.integrator = INTEGRATOR_NAMES[int(event["x"])]
+
+    def advance(self):
+        self.ships.move(self.planets, self.dt)
+        self.ships.cull(self.planets)
+        self.ships.record_trail()
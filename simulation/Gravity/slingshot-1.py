@@ -1,19 +1,35 @@
+import argparse
+from time import perf_counter_ns
+
+import numpy as np
 import pygame
-import math
 
-pygame.init()
+import baru  # noqa: F401  (telemetry, perf and render come from the GLBB app)
+from physics import (
+    WIDTH, HEIGHT, PLANET_SIZE, OBJ_SIZE,
+    TIME_UNIT, PHYSICS_DT, MAX_STEPS_PER_FRAME,
+    ShipStore, create_ship, load_scene,
+)
+from integrators import INTEGRATORS
+from prediction import TrajectoryPredictor
+from renderer import DirtyRenderer
+from trails import TrailPainter
+from session import (
+    SlingshotRecorder, SlingshotReplay, METHODS, INTEGRATOR_NAMES,
+    SCENE, SHIP_GRAVITY, METHOD, INTEGRATOR,
+)
+from telemetry import TelemetryWriter
+from perf import PerfStats, PerfOverlay
+from render import PygameBackend
+
+# Only the display is needed (no text, sound or joysticks); pygame.init()
+# would also start audio, which is slow and can fail on machines without it
+pygame.display.init()
 
-WIDTH, HEIGHT = 800, 600
 win = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Gravitational Slingshot Effect")
 
-PLANET_MASS = 100
-SHIP_MASS = 5
-G = 5
 FPS = 60
-PLANET_SIZE = 50
-OBJ_SIZE = 5
-VEL_SCALE = 100
 
 BG = pygame.transform.scale(pygame.image.load("assets\images\slingshot-background.jpg"), (WIDTH, HEIGHT))
 PLANET = pygame.transform.scale(pygame.image.load("assets\images\slingshot-jupiter.png"), (PLANET_SIZE * 2, PLANET_SIZE * 2))
@@ -21,94 +37,212 @@ PLANET = pygame.transform.scale(pygame.image.load("assets\images\slingshot-jupit
 WHITE = (255, 255, 255)
 RED = (255, 0, 0)
 BLUE = (0, 0, 255)
+PREDICTION_COLOR = (120, 160, 255)
+TRAIL_COLOR = (255, 140, 90)
+
+SCENE_KEYS = {pygame.K_1: 1, pygame.K_2: 2, pygame.K_3: 3}
+
+# Replay scrubbing, in physics steps
+SEEK_SMALL = 60
+SEEK_LARGE = 600
+
+TELEMETRY_COLUMNS = ["step", "id", "x", "y", "vx", "vy"]
+
+PERF_STAGES = ["step", "draw", "display"]
+
+def draw_planet(planet):
+    win.blit(PLANET, (planet.x - PLANET_SIZE, planet.y - PLANET_SIZE))
 
-class Planet:
-    def __init__(self, x, y, mass):
-        self.x = x
-        self.y = y
-        self.mass = mass
-    
-    def draw(self):
-        win.blit(PLANET, (self.x - PLANET_SIZE, self.y - PLANET_SIZE))
-
-class Spacecraft:
-    def __init__(self, x, y, vel_x, vel_y, mass):
-        self.x = x
-        self.y = y
-        self.vel_x = vel_x
-        self.vel_y = vel_y
-        self.mass = mass
-
-    def move(self, planet=None):
-        distance = math.sqrt((self.x - planet.x)**2 + (self.y - planet.y)**2)
-        force = (G * self.mass * planet.mass) / distance ** 2
-        
-        acceleration = force / self.mass
-        angle = math.atan2(planet.y - self.y, planet.x - self.x)
-
-        acceleration_x = acceleration * math.cos(angle)
-        acceleration_y = acceleration * math.sin(angle)
-
-        self.vel_x += acceleration_x
-        self.vel_y += acceleration_y
-
-        self.x += self.vel_x
-        self.y += self.vel_y
-    
-    def draw(self):
-        pygame.draw.circle(win, RED, (int(self.x), int(self.y)), OBJ_SIZE)
-
-def create_ship(location, mouse):
-    t_x, t_y = location
-    m_x, m_y = mouse
-    vel_x = (m_x - t_x) / VEL_SCALE
-    vel_y = (m_y - t_y) / VEL_SCALE
-    obj = Spacecraft(t_x, t_y, vel_x, vel_y, SHIP_MASS)
-    return obj
-
-def main():
+def draw_ships(ships, renderer):
+    for x, y in ships.positions.astype(int).tolist():
+        renderer.mark(pygame.draw.circle(win, RED, (x, y), OBJ_SIZE))
+
+def write_telemetry(telemetry, step, ships):
+    n = ships.count
+    if n:
+        telemetry.write_many(np.column_stack((np.full(n, step), ships.ids[:n],
+                                              ships.pos[:n], ships.vel[:n])))
+
+def perf_overlay_backend():
+    # Fonts are only needed once the overlay is first shown
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return PygameBackend(win, pygame.font.SysFont("monospace", 14))
+
+def main(record=None, replay=None, telemetry=None):
     running = True
     clock = pygame.time.Clock()
 
-    planet = Planet(WIDTH // 2, HEIGHT // 2, PLANET_MASS)
-    objects = []
+    scene = 1
+    planets = load_scene(scene)
+    ships = ShipStore()
+    predictor = TrajectoryPredictor()
+    renderer = DirtyRenderer(win, BG)
+    trail_painter = TrailPainter(win, BG, TRAIL_COLOR)
     temp_obj_pos = None
+    accumulator = 0.0
+    step = 0
+
+    recorder = SlingshotRecorder(record) if record else None
+    telemetry = TelemetryWriter(telemetry, TELEMETRY_COLUMNS) if telemetry else None
+    if replay:
+        replay = SlingshotReplay(replay)
+        replay.seek(0)
+    paused = False
+
+    perf = PerfStats()
+    overlay = None
+    overlay_backend = None
 
     while running:
-        clock.tick(FPS)
+        # Physics runs in fixed PHYSICS_DT steps of simulated time, however
+        # long the frame actually took
+        accumulator += clock.tick(FPS) / 1000 / TIME_UNIT
+        perf.frame()
 
         mouse_pos = pygame.mouse.get_pos()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                if overlay is None:
+                    overlay_backend = overlay_backend or perf_overlay_backend()
+                    overlay = PerfOverlay(perf, PERF_STAGES, line_height=18, budget_ms=1000 / FPS)
+                else:
+                    overlay = None
+                continue
+
+            if replay:
+                if event.type == pygame.KEYDOWN:
+                    jump = SEEK_LARGE if event.mod & pygame.KMOD_SHIFT else SEEK_SMALL
+                    if event.key == pygame.K_SPACE:
+                        paused = not paused
+                    elif event.key == pygame.K_LEFT:
+                        replay.seek(replay.step - jump)
+                    elif event.key == pygame.K_RIGHT:
+                        replay.seek(replay.step + jump)
+                    elif event.key == pygame.K_HOME:
+                        replay.seek(0)
+                    elif event.key == pygame.K_END:
+                        replay.seek(replay.length)
+                    elif event.key == pygame.K_t:
+                        if replay.ships.trail is None:
+                            replay.ships.enable_trails()
+                        else:
+                            replay.ships.disable_trails()
+                continue
             
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if temp_obj_pos:
-                    obj = create_ship(temp_obj_pos, mouse_pos)
-                    objects.append(obj)
+                    ship = create_ship(temp_obj_pos, mouse_pos)
+                    ship_id = ships.add(ship)
+                    if recorder:
+                        recorder.launch(step, ship_id, ship)
                     temp_obj_pos = None
                 else:
                     temp_obj_pos = mouse_pos
 
-        win.blit(BG, (0, 0))
+            if event.type == pygame.KEYDOWN:
+                if event.key in SCENE_KEYS:
+                    scene = SCENE_KEYS[event.key]
+                    planets = load_scene(scene)
+                    renderer.invalidate()
+                    if recorder:
+                        recorder.event(step, SCENE, scene)
+                elif event.key == pygame.K_g:
+                    ships.ship_gravity = not ships.ship_gravity
+                    if recorder:
+                        recorder.event(step, SHIP_GRAVITY, ships.ship_gravity)
+                elif event.key == pygame.K_b:
+                    ships.method = "direct" if ships.method == "barnes_hut" else "barnes_hut"
+                    if recorder:
+                        recorder.event(step, METHOD, METHODS.index(ships.method))
+                elif event.key == pygame.K_i:
+                    names = list(INTEGRATORS)
+                    ships.integrator = names[(names.index(ships.integrator) + 1) % len(names)]
+                    if recorder:
+                        recorder.event(step, INTEGRATOR, INTEGRATOR_NAMES.index(ships.integrator))
+                elif event.key == pygame.K_t:
+                    if ships.trail is None:
+                        ships.enable_trails()
+                    else:
+                        ships.disable_trails()
+
+        if replay:
+            if replay.scene != scene:
+                scene = replay.scene
+                renderer.invalidate()
+            ships, planets = replay.ships, replay.planets
+
+        draw_start = perf_counter_ns()
+        renderer.begin()
+
+        for rect in trail_painter.draw(ships):
+            renderer.mark(rect)
 
         if temp_obj_pos:
-            pygame.draw.line(win, WHITE, temp_obj_pos, mouse_pos, 2)
-            pygame.draw.circle(win, RED, temp_obj_pos, OBJ_SIZE)
-        
-        for obj in objects[:]:
-            obj.draw()
-            obj.move(planet)
-            off_screen = obj.x < 0 or obj.x > WIDTH or obj.y < 0 or obj.y > HEIGHT
-            collided = math.sqrt((obj.x - planet.x)**2 + (obj.y - planet.y)**2) <= PLANET_SIZE
-            if off_screen or collided:
-                objects.remove(obj)
-
-        planet.draw()
-
-        pygame.display.update()
-    
+            path = predictor.path(temp_obj_pos, mouse_pos, planets, ships.integrator)
+            if len(path) > 1:
+                renderer.mark(pygame.draw.lines(win, PREDICTION_COLOR, False, path.tolist(), 1))
+            renderer.mark(pygame.draw.line(win, WHITE, temp_obj_pos, mouse_pos, 2))
+            renderer.mark(pygame.draw.circle(win, RED, temp_obj_pos, OBJ_SIZE))
+
+        draw_ships(ships, renderer)
+        step_start = perf_counter_ns()
+        steps = 0
+        while accumulator >= PHYSICS_DT and steps < MAX_STEPS_PER_FRAME:
+            if replay:
+                if not paused and replay.step < replay.length:
+                    replay.seek(replay.step + 1)
+                    if telemetry:
+                        write_telemetry(telemetry, replay.step, replay.ships)
+            else:
+                if recorder:
+                    recorder.capture(step, ships, scene)
+                ships.move(planets, PHYSICS_DT)
+                ships.cull(planets)
+                ships.record_trail()
+                step += 1
+                if telemetry:
+                    write_telemetry(telemetry, step, ships)
+            accumulator -= PHYSICS_DT
+            steps += 1
+        if steps == MAX_STEPS_PER_FRAME:
+            # Too far behind to catch up; drop the backlog instead of spiralling
+            accumulator = min(accumulator, PHYSICS_DT)
+        step_end = perf_counter_ns()
+        perf.add("step", step_end - step_start)
+
+        for planet in planets:
+            # Planets never move, so they only need redrawing over restored
+            # background and never add dirty rects of their own
+            draw_planet(planet)
+
+        if overlay is not None:
+            overlay.render(overlay_backend)
+            renderer.mark(pygame.Rect(overlay.rect))
+
+        display_start = perf_counter_ns()
+        # Drawing happens on both sides of the physics steps
+        perf.add("draw", display_start - draw_start - (step_end - step_start))
+        renderer.end()
+        perf.add("display", perf_counter_ns() - display_start)
+
+    if recorder:
+        recorder.close(step, ships, scene)
+    if telemetry:
+        telemetry.close()
+        if telemetry.error is not None:
+            print(f"Telemetry stopped early: {telemetry.error}")
+        if telemetry.dropped:
+            print(f"{telemetry.dropped} telemetry rows were not written")
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Gravitational slingshot simulation")
+    parser.add_argument("--record", metavar="PATH", help="record this session to PATH")
+    parser.add_argument("--replay", metavar="PATH", help="replay a recorded session")
+    parser.add_argument("--telemetry", metavar="PATH",
+                        help="stream every ship's state per step to PATH (.csv, otherwise binary)")
+    args = parser.parse_args()
+    main(record=args.record, replay=args.replay, telemetry=args.telemetry)
@@ -0,0 +1,145 @@
+"""Headless launch-parameter sweep for the slingshot simulation.
+
+Every combination of launch position and velocity is flown with the same
+physics and removal rules as the window (`ShipStore.move`, `ShipStore.dead`)
+until the ship leaves the screen, hits a planet or runs out of steps. Runs
+are split into chunks across a process pool; each chunk is one batched
+`ShipStore`. Example::
+
+    python sweep.py --x 0 800 81 --y 0 600 61 --vx -3 3 25 --vy -3 3 25 --out gain_map.npz
+"""
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from physics import PHYSICS_DT, INTEGRATOR, SHIP_MASS, SCENES, ShipStore, load_scene
+from integrators import INTEGRATORS
+
+ESCAPED, CAPTURED, COLLIDED = 0, 1, 2
+OUTCOMES = ("escaped", "captured", "collided")
+
+MAX_STEPS = 5000
+CHUNK_SIZE = 65536   # most launches per chunk, to bound each worker's memory
+
+
+def launch_grid(xs, ys, vxs, vys):
+    """Every (x, y, vx, vy) combination as flat ``(pos, vel)`` arrays."""
+    x, y, vx, vy = np.meshgrid(xs, ys, vxs, vys, indexing="ij")
+    pos = np.stack((x.ravel(), y.ravel()), axis=1)
+    vel = np.stack((vx.ravel(), vy.ravel()), axis=1)
+    return pos, vel
+
+
+def simulate(pos, vel, planets, max_steps=MAX_STEPS, dt=PHYSICS_DT, integrator=INTEGRATOR):
+    """Fly each launch to the end and return ``(outcome, speed_gain)``.
+
+    ``speed_gain`` is exit speed minus launch speed for escaped ships and
+    NaN otherwise. Ships still flying after ``max_steps`` count as captured.
+    """
+    n = len(pos)
+    outcome = np.full(n, CAPTURED, dtype=np.int8)
+    gain = np.full(n, np.nan)
+    launch_speed = np.hypot(vel[:, 0], vel[:, 1])
+
+    ships = ShipStore(capacity=max(n, 1), ship_gravity=False, integrator=integrator)
+    ships.add_many(pos, vel, SHIP_MASS)
+    # Launches from inside a planet are collisions before the first step
+    _, inside = ships.dead(planets)
+    outcome[ships.ids[:ships.count][inside]] = COLLIDED
+    ships.compact(inside)
+
+    for _ in range(max_steps):
+        if ships.count == 0:
+            break
+        ships.move(planets, dt)
+        off_screen, collided = ships.dead(planets)
+        ids = ships.ids[:ships.count]
+        escaped = off_screen & ~collided
+        outcome[ids[collided]] = COLLIDED
+        outcome[ids[escaped]] = ESCAPED
+        exit_vel = ships.vel[:ships.count][escaped]
+        gain[ids[escaped]] = np.hypot(exit_vel[:, 0], exit_vel[:, 1]) - launch_speed[ids[escaped]]
+        ships.compact(off_screen | collided)
+    return outcome, gain
+
+
+def _simulate_chunk(args):
+    pos, vel, scene, max_steps, dt, integrator = args
+    return simulate(pos, vel, load_scene(scene), max_steps, dt, integrator)
+
+
+def run_sweep(pos, vel, scene=1, max_steps=MAX_STEPS, dt=PHYSICS_DT, integrator=INTEGRATOR,
+              workers=None, chunk_size=None):
+    """`simulate` split into chunks over a process pool; results keep input order.
+
+    By default there are about four chunks per worker, so every worker gets
+    some and a slow chunk does not hold up the end. No chunk is larger than
+    `CHUNK_SIZE`.
+    """
+    if chunk_size is None:
+        per_worker = 4 * (workers or os.cpu_count() or 1)
+        chunk_size = min(CHUNK_SIZE, max(1, math.ceil(len(pos) / per_worker)))
+    chunks = [
+        (pos[i:i + chunk_size], vel[i:i + chunk_size], scene, max_steps, dt, integrator)
+        for i in range(0, len(pos), chunk_size)
+    ]
+    if workers == 1 or len(chunks) <= 1:
+        results = [_simulate_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_simulate_chunk, chunks))
+    if not results:
+        return np.zeros(0, dtype=np.int8), np.zeros(0)
+    return (np.concatenate([r[0] for r in results]),
+            np.concatenate([r[1] for r in results]))
+
+
+def _axis(values):
+    start, stop, num = values
+    return np.linspace(float(start), float(stop), int(num))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--x", nargs=3, default=(0, 800, 41), metavar=("START", "STOP", "NUM"))
+    parser.add_argument("--y", nargs=3, default=(0, 600, 31), metavar=("START", "STOP", "NUM"))
+    parser.add_argument("--vx", nargs=3, default=(-3, 3, 13), metavar=("START", "STOP", "NUM"))
+    parser.add_argument("--vy", nargs=3, default=(-3, 3, 13), metavar=("START", "STOP", "NUM"))
+    parser.add_argument("--scene", type=int, default=1, choices=sorted(SCENES))
+    parser.add_argument("--steps", type=int, default=MAX_STEPS)
+    parser.add_argument("--dt", type=float, default=PHYSICS_DT)
+    parser.add_argument("--integrator", default=INTEGRATOR, choices=sorted(INTEGRATORS))
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk", type=int, default=None,
+                        help=f"launches per chunk (default: about 4 chunks per worker, "
+                             f"at most {CHUNK_SIZE})")
+    parser.add_argument("--out", default="gain_map.npz")
+    args = parser.parse_args()
+
+    xs, ys, vxs, vys = _axis(args.x), _axis(args.y), _axis(args.vx), _axis(args.vy)
+    pos, vel = launch_grid(xs, ys, vxs, vys)
+    shape = (len(xs), len(ys), len(vxs), len(vys))
+
+    started = time.perf_counter()
+    outcome, gain = run_sweep(pos, vel, args.scene, args.steps, args.dt, args.integrator,
+                              args.workers, args.chunk)
+    elapsed = time.perf_counter() - started
+
+    np.savez_compressed(
+        args.out,
+        x=xs, y=ys, vx=vxs, vy=vys,
+        outcome=outcome.reshape(shape),
+        speed_gain=gain.reshape(shape),
+        scene=args.scene,
+    )
+    counts = np.bincount(outcome, minlength=len(OUTCOMES))
+    summary = ", ".join(f"{name} {count}" for name, count in zip(OUTCOMES, counts))
+    print(f"{len(pos)} launches in {elapsed:.1f}s ({summary}) -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import numpy as np
+import pygame
+
+from renderer import DIRTY_RECT_LIMIT
+
+
+class TrailPainter:
+    """Draws every ship's trail in one vectorized pixel write per frame.
+
+    Trail samples come from `ShipStore.trail`. Each visible sample is
+    blended between the background and ``color`` by its age, straight into
+    the window's pixel array, so no per-ship Python drawing happens.
+    """
+
+    def __init__(self, win, background, color):
+        self.win = win
+        self.background = pygame.surfarray.array3d(background)
+        self.color = np.array(color, dtype=np.float32)
+        self.width, self.height = win.get_size()
+
+    def draw(self, ships):
+        """Paint the trails and return the rects they cover."""
+        n = ships.count
+        if ships.trail is None or n == 0:
+            return []
+        trail = ships.trail[:n]
+        length = trail.shape[1]
+        # 0 for the newest sample, length - 1 for the oldest
+        age = (ships.trail_head - np.arange(length)) % length
+        visible = age[None, :] < ships.trail_age[:n, None]
+
+        x = trail[..., 0].astype(np.int32)
+        y = trail[..., 1].astype(np.int32)
+        visible &= (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        if not visible.any():
+            return []
+
+        rows, slots = np.nonzero(visible)
+        px, py = x[rows, slots], y[rows, slots]
+        alpha = (1.0 - age[slots] / length).astype(np.float32)[:, None]
+        background = self.background[px, py]
+        pixels = pygame.surfarray.pixels3d(self.win)
+        pixels[px, py] = background + (self.color - background) * alpha
+        del pixels
+
+        if n > DIRTY_RECT_LIMIT:
+            return [pygame.Rect(int(px.min()), int(py.min()),
+                                int(px.max() - px.min()) + 1, int(py.max() - py.min()) + 1)]
+        big = np.iinfo(np.int32).max
+        x0 = np.where(visible, x, big).min(axis=1)
+        y0 = np.where(visible, y, big).min(axis=1)
+        x1 = np.where(visible, x, -1).max(axis=1)
+        y1 = np.where(visible, y, -1).max(axis=1)
+        shown = x1 >= 0
+        return [pygame.Rect(a, b, c - a + 1, d - b + 1)
+                for a, b, c, d in zip(x0[shown].tolist(), y0[shown].tolist(),
+                                      x1[shown].tolist(), y1[shown].tolist())]
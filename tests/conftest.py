@@ -0,0 +1,6 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "simulation", "Gravity"))
+sys.path.insert(0, os.path.join(ROOT, "BARU"))
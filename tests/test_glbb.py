@@ -0,0 +1,64 @@
+"""GLBBSimulation.advance must land exactly where repeated step() calls do."""
+import pytest
+
+from glbb import GLBBSimulation
+
+DT = 1 / 60.0
+
+
+def _stepped_and_advanced(acceleration, steps, warmup=0, warmup_acceleration=None):
+    stepped, advanced = GLBBSimulation(), GLBBSimulation()
+    for sim in (stepped, advanced):
+        sim.set_acceleration(acceleration if warmup_acceleration is None else warmup_acceleration)
+        for _ in range(warmup):
+            sim.step(DT)
+        sim.set_acceleration(acceleration)
+    assert advanced.is_analytic()
+    for _ in range(steps):
+        stepped.step(DT)
+    advanced.advance(steps, DT)
+    return stepped, advanced
+
+
+def _assert_same_state(stepped, advanced):
+    a, b = stepped.box_body, advanced.box_body
+    assert advanced.steps == stepped.steps
+    assert b.position.x == pytest.approx(a.position.x, abs=1e-6)
+    assert b.position.y == pytest.approx(a.position.y, abs=1e-9)
+    assert b.velocity.x == pytest.approx(a.velocity.x, abs=1e-6)
+    # draw(alpha) interpolates from the state one step earlier
+    assert advanced._previous[0].x == pytest.approx(stepped._previous[0].x, abs=1e-6)
+
+
+@pytest.mark.parametrize("acceleration, steps", [
+    (0.0, 50),
+    (3.0, 120),      # stays clear of the walls
+    (-2.5, 90),
+])
+def test_free_motion(acceleration, steps):
+    _assert_same_state(*_stepped_and_advanced(acceleration, steps))
+
+
+@pytest.mark.parametrize("acceleration, steps", [
+    (40.0, 400),     # hits the right wall part way through
+    (-40.0, 400),    # and the left one
+])
+def test_wall_contact(acceleration, steps):
+    stepped, advanced = _stepped_and_advanced(acceleration, steps)
+    half_width = stepped.box_width / 2
+    assert stepped.box_body.position.x in (half_width, stepped.width - half_width)
+    _assert_same_state(stepped, advanced)
+
+
+def test_turns_back_before_the_wall():
+    # Moving right, then braking hard enough to turn round mid-advance
+    _assert_same_state(*_stepped_and_advanced(-30.0, 240, warmup=60, warmup_acceleration=20.0))
+
+
+@pytest.mark.parametrize("steps", [400, 401])
+def test_pinned_against_the_wall(steps):
+    # Pushed into the wall, step() leaves v alternating between 0 and a*dt;
+    # both parities have to match
+    stepped, advanced = _stepped_and_advanced(60.0, steps, warmup=200)
+    assert stepped.box_body.position.x == stepped.width - stepped.box_width / 2
+    _assert_same_state(stepped, advanced)
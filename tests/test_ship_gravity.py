@@ -0,0 +1,32 @@
+"""Barnes-Hut ship-ship gravity must stay close to the exact direct sum."""
+import numpy as np
+import pytest
+
+from physics import ShipStore
+
+
+def _store(method, n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    store = ShipStore(ship_gravity=True, method=method)
+    store.add_many(rng.uniform(0, 800, (n, 2)), np.zeros((n, 2)), rng.uniform(1, 10, n))
+    return store
+
+
+@pytest.mark.parametrize("n", [2, 50, 400])
+def test_barnes_hut_matches_direct(n):
+    planets = []
+    direct = _store("direct", n).accelerations(planets)
+    approx = _store("barnes_hut", n).accelerations(planets)
+    error = np.linalg.norm(approx - direct, axis=1)
+    typical = np.median(np.linalg.norm(direct, axis=1))
+    # Relative error is only large where the pulls nearly cancel out, so the
+    # worst case is measured against a typical acceleration instead
+    assert np.median(error / np.linalg.norm(direct, axis=1)) < 0.02
+    assert error.max() < 0.1 * typical
+
+
+def test_barnes_hut_exact_for_theta_zero():
+    direct = _store("direct").accelerations([])
+    store = _store("barnes_hut")
+    store.theta = 0.0
+    np.testing.assert_allclose(store.accelerations([]), direct, rtol=1e-9, atol=1e-12)